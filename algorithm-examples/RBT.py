@@ -5,9 +5,19 @@
 4. If a node is red, both children are black
 5. For each node, all paths from the node to descendant leaves contain the same number of black nodes"""
 
+from array import array
+
 #Max height 2log(n+1)
+#Each node also stores its subtree size (kept up to date by insert, delete and the rotations),
+#which gives O(log n) rank/select and range counts (CLRS 14.1 order-statistic trees).
+def _size(node):
+    return node.size if node is not None else 0
+
 # class to implement node of RB Tree (assistance from https://www.geeksforgeeks.org/python/red-black-tree-in-python/)
 class RBNode:
+    # no per-node __dict__, which is most of the memory of a small object
+    __slots__ = ('value', 'color', 'left', 'right', 'parent', 'size')
+
         # cnostructor
     def __init__(self, value, color='red'):
         self.value = value
@@ -15,6 +25,7 @@ class RBNode:
         self.left = None
         self.right = None
         self.parent = None
+        self.size = 1  # number of nodes in the subtree rooted here
 
     # function to get the grandparent of node
     def grandparent(self):
@@ -41,6 +52,9 @@ class RedBlackTree:
     def __init__(self):
         self.root = None
 
+    def __len__(self):
+        return _size(self.root)
+
     # function to search a value in RB Tree
     def search(self, value):
         curr_node = self.root
@@ -62,6 +76,7 @@ class RedBlackTree:
         else:
             curr_node = self.root
             while True:
+                curr_node.size += 1
                 if value < curr_node.value:
                     if curr_node.left is None:
                         curr_node.left = new_node
@@ -109,7 +124,10 @@ class RedBlackTree:
                     new_node.parent.color = 'black'
                     new_node.grandparent().color = 'red'
                     self.rotate_left(new_node.grandparent())
+        # a red root being recoloured is the only way the black height grows
+        grew = self.root.color == 'red'
         self.root.color = 'black'
+        return grew
 
     # function to delete a value from RB Tree
     def delete(self, value):
@@ -118,64 +136,81 @@ class RedBlackTree:
         if node_to_remove is None:
             return
 
-        if node_to_remove.left is None or node_to_remove.right is None:
-            self._replace_node(
-                node_to_remove, node_to_remove.left or node_to_remove.right)
-        else:
+        if node_to_remove.left is not None and node_to_remove.right is not None:
             successor = self._find_min(node_to_remove.right)
             node_to_remove.value = successor.value
-            self._replace_node(successor, successor.right)
+            node_to_remove = successor
 
-        self.delete_fix(node_to_remove)
+        # node_to_remove now has at most one child
+        child = node_to_remove.left or node_to_remove.right
+        parent = node_to_remove.parent
+        self._replace_node(node_to_remove, child)
+
+        node = parent
+        while node is not None:
+            node.size -= 1
+            node = node.parent
+
+        if node_to_remove.color == 'black':
+            if child is not None and child.color == 'red':
+                child.color = 'black'
+            else:
+                self.delete_fix(child, parent)
 
     # function to fix RB Tree properties after deletion
-    def delete_fix(self, x):
-        while x != self.root and x.color == 'black':
-            if x == x.parent.left:
-                sibling = x.sibling()
+    # x carries the extra black and may be None (an empty leaf), so its parent is passed in
+    def delete_fix(self, x, parent=None):
+        if x is not None:
+            parent = x.parent
+        while x is not self.root and (x is None or x.color == 'black'):
+            if x is parent.left:
+                sibling = parent.right
                 if sibling.color == 'red':
                     sibling.color = 'black'
-                    x.parent.color = 'red'
-                    self.rotate_left(x.parent)
-                    sibling = x.sibling()
+                    parent.color = 'red'
+                    self.rotate_left(parent)
+                    sibling = parent.right
                 if (sibling.left is None or sibling.left.color == 'black') and (sibling.right is None or sibling.right.color == 'black'):
                     sibling.color = 'red'
-                    x = x.parent
+                    x = parent
+                    parent = x.parent
                 else:
                     if sibling.right is None or sibling.right.color == 'black':
                         sibling.left.color = 'black'
                         sibling.color = 'red'
                         self.rotate_right(sibling)
-                        sibling = x.sibling()
-                    sibling.color = x.parent.color
-                    x.parent.color = 'black'
+                        sibling = parent.right
+                    sibling.color = parent.color
+                    parent.color = 'black'
                     if sibling.right:
                         sibling.right.color = 'black'
-                    self.rotate_left(x.parent)
+                    self.rotate_left(parent)
                     x = self.root
             else:
-                sibling = x.sibling()
+                sibling = parent.left
                 if sibling.color == 'red':
                     sibling.color = 'black'
-                    x.parent.color = 'red'
-                    self.rotate_right(x.parent)
-                    sibling = x.sibling()
+                    parent.color = 'red'
+                    self.rotate_right(parent)
+                    sibling = parent.left
                 if (sibling.left is None or sibling.left.color == 'black') and (sibling.right is None or sibling.right.color == 'black'):
                     sibling.color = 'red'
-                    x = x.parent
+                    x = parent
+                    parent = x.parent
                 else:
                     if sibling.left is None or sibling.left.color == 'black':
                         sibling.right.color = 'black'
                         sibling.color = 'red'
                         self.rotate_left(sibling)
-                        sibling = x.sibling()
-                    sibling.color = x.parent.color
-                    x.parent.color = 'black'
+                        sibling = parent.left
+                    sibling.color = parent.color
+                    parent.color = 'black'
                     if sibling.left:
                         sibling.left.color = 'black'
-                    self.rotate_right(x.parent)
+                    self.rotate_right(parent)
                     x = self.root
-        x.color = 'black'
+        if x is not None:
+            x.color = 'black'
 
     # Function for left rotation of RB Tree
     def rotate_left(self, node):
@@ -197,6 +232,9 @@ class RedBlackTree:
         right_child.left = node
         node.parent = right_child
 
+        right_child.size = node.size
+        node.size = 1 + _size(node.left) + _size(node.right)
+
     # function for right rotation of RB Tree
     def rotate_right(self, node):
         left_child = node.left
@@ -217,6 +255,9 @@ class RedBlackTree:
         left_child.right = node
         node.parent = left_child
 
+        left_child.size = node.size
+        node.size = 1 + _size(node.left) + _size(node.right)
+
     # function to replace an old node with a new node
     def _replace_node(self, old_node, new_node):
         if old_node.parent is None:
@@ -235,9 +276,489 @@ class RedBlackTree:
             node = node.left
         return node
 
-    # function to perform inorder traversal
+    # function to find the next node in sorted order, O(1) amortized over a full walk
+    def successor(self, node):
+        if node.right is not None:
+            return self._find_min(node.right)
+        parent = node.parent
+        while parent is not None and node is parent.right:
+            node = parent
+            parent = parent.parent
+        return parent
+
+    # function to find the previous node in sorted order
+    def predecessor(self, node):
+        if node.left is not None:
+            node = node.left
+            while node.right is not None:
+                node = node.right
+            return node
+        parent = node.parent
+        while parent is not None and node is parent.left:
+            node = parent
+            parent = parent.parent
+        return parent
+
+    # lazily yields all values in sorted order using parent pointers, no stack or recursion
+    def inorder(self):
+        if self.root is None:
+            return
+        node = self._find_min(self.root)
+        while node is not None:
+            yield node.value
+            node = self.successor(node)
+
+    # function to perform inorder traversal (iterative so deep trees cannot hit the recursion limit)
     def _inorder_traversal(self, node):
-        if node is not None:
-            self._inorder_traversal(node.left)
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
             print(node.value, end=" ")
-            self._inorder_traversal(node.right)
\ No newline at end of file
+            node = node.right
+
+    # number of values strictly less than value
+    def rank(self, value):
+        r = 0
+        node = self.root
+        while node is not None:
+            if node.value < value:
+                r += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return r
+
+    # k-th smallest value, 0-indexed
+    def select(self, k):
+        if not 0 <= k < _size(self.root):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.value
+            else:
+                k -= left + 1
+                node = node.right
+
+    # number of values v with lo <= v < hi
+    def count_range(self, lo, hi):
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    # lazily yields values v with lo <= v < hi in sorted order, O(log n + k)
+    def range(self, lo, hi):
+        stack = []
+        node = self.root
+        while node is not None:
+            if node.value < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if not node.value < hi:
+                return
+            yield node.value
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    # O(n) bulk load from sorted values: split at the midpoint, colour only the deepest
+    # level red (when it is not full) so every root-to-leaf path has the same black count
+    @classmethod
+    def from_sorted(cls, values):
+        values = list(values)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("values must be sorted")
+        tree = cls()
+        n = len(values)
+        if n == 0:
+            return tree
+        deepest = n.bit_length() - 1
+        red_leaves = (n + 1) & n != 0  # n + 1 not a power of two -> last level is partial
+
+        def build(lo, hi, depth, parent):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = RBNode(values[mid], 'red' if red_leaves and depth == deepest and depth > 0 else 'black')
+            node.parent = parent
+            node.left = build(lo, mid, depth + 1, node)
+            node.right = build(mid + 1, hi, depth + 1, node)
+            node.size = hi - lo
+            return node
+
+        tree.root = build(0, n, 0, None)
+        return tree
+
+    # number of black nodes on any path from the root down to a leaf
+    def _black_height(self):
+        h = 0
+        node = self.root
+        while node is not None:
+            if node.color == 'black':
+                h += 1
+            node = node.left
+        return h
+
+    # wraps a detached subtree as its own tree; a red root is recoloured black
+    @classmethod
+    def _from_root(cls, node):
+        tree = cls()
+        if node is not None:
+            node.parent = None
+            node.color = 'black'
+            tree.root = node
+        return tree
+
+    # function to append the values of other (all >= self's values) to this tree in O(log n)
+    # value is the separating value, if None the minimum of other is used; other is left empty
+    def join(self, other, value=None):
+        if value is None:
+            if other.root is None:
+                return self
+            value = other._find_min(other.root).value
+            other.delete(value)
+        if (self.root is not None and value < self._find_max(self.root).value) or \
+                (other.root is not None and other._find_min(other.root).value < value):
+            raise ValueError("values of self must be <= value <= values of other")
+        self._join(self, value, other)
+        other.root = None
+        return self
+
+    # joins into left and returns (left, its black height); black heights not given are measured
+    @staticmethod
+    def _join(left, value, right, bh_left=None, bh_right=None):
+        if left.root is None:
+            left.root = right.root
+            left.insert(value)
+            return left, left._black_height()
+        if right.root is None:
+            left.insert(value)
+            return left, left._black_height()
+        if bh_left is None:
+            bh_left = left._black_height()
+        if bh_right is None:
+            bh_right = right._black_height()
+        node = RBNode(value)
+        if bh_left >= bh_right:
+            # walk down the right spine of left to a black node of the same black height
+            y, h = left.root, bh_left
+            while not (y.color == 'black' and h == bh_right):
+                y.size += 1 + right.root.size
+                if y.color == 'black':
+                    h -= 1
+                y = y.right
+            left._replace_node(y, node)
+            node.left = y
+            node.right = right.root
+        else:
+            y, h = right.root, bh_right
+            while not (y.color == 'black' and h == bh_left):
+                y.size += 1 + left.root.size
+                if y.color == 'black':
+                    h -= 1
+                y = y.left
+            right._replace_node(y, node)
+            node.left = left.root
+            node.right = y
+            left.root = right.root
+        node.left.parent = node
+        node.right.parent = node
+        node.size = 1 + node.left.size + node.right.size
+        grew = left.insert_fix(node)
+        return left, max(bh_left, bh_right) + grew
+
+    # function to split into (values < key, values >= key) in O(log n); this tree is left empty
+    def split(self, key):
+        lower, _, upper, _ = self._split(key, self._black_height())
+        return lower, upper
+
+    # split of this tree, whose black height is bh, as (lower, its black height, upper, its black height);
+    # black heights are passed down so each join is O(1 + height difference)
+    def _split(self, key, bh):
+        cls = type(self)
+        root = self.root
+        self.root = None
+        if root is None:
+            return cls(), 0, cls(), 0
+        # below the black root each side has bh - 1, plus one for a red child made black as a root
+        bh_left = bh - 1 + (root.left is not None and root.left.color == 'red')
+        bh_right = bh - 1 + (root.right is not None and root.right.color == 'red')
+        left_sub = cls._from_root(root.left)
+        right_sub = cls._from_root(root.right)
+        root.left = root.right = None
+        if key <= root.value:
+            lower, bh_lower, upper, bh_upper = left_sub._split(key, bh_left)
+            upper, bh_upper = cls._join(upper, root.value, right_sub, bh_upper, bh_right)
+            return lower, bh_lower, upper, bh_upper
+        lower, bh_lower, upper, bh_upper = right_sub._split(key, bh_right)
+        lower, bh_lower = cls._join(left_sub, root.value, lower, bh_left, bh_lower)
+        return lower, bh_lower, upper, bh_upper
+
+    # function to find node with maximum value in a subtree
+    def _find_max(self, node):
+        while node.right is not None:
+            node = node.right
+        return node
+
+#Compact variant: nodes are integer slots in parallel typed arrays instead of objects.
+#Slot 0 is the shared black sentinel NIL (CLRS 13), children/parents are slot indices
+#and colour is one byte, so a node costs ~21 bytes for int keys instead of a Python object.
+#Deleted slots are recycled through a free list.
+NIL = 0
+BLACK = 0
+RED = 1
+
+class CompactRedBlackTree:
+    # typecode: array typecode of the keys, 'q' for 64-bit ints or 'd' for floats
+    def __init__(self, typecode='q'):
+        self.key = array(typecode, [0])
+        self.left = array('i', [NIL])
+        self.right = array('i', [NIL])
+        self.parent = array('i', [NIL])
+        self.color = array('b', [BLACK])
+        self.root = NIL
+        self.free = array('i')
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, key):
+        return self.search(key) != NIL
+
+    def __iter__(self):
+        x = self.minimum(self.root) if self.root != NIL else NIL
+        key = self.key
+        while x != NIL:
+            yield key[x]
+            x = self.successor(x)
+
+    def _new_node(self, key):
+        if self.free:
+            x = self.free.pop()
+            self.key[x] = key
+            self.left[x] = self.right[x] = self.parent[x] = NIL
+            self.color[x] = RED
+        else:
+            x = len(self.key)
+            self.key.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+            self.parent.append(NIL)
+            self.color.append(RED)
+        return x
+
+    # returns the slot holding key, or NIL
+    def search(self, key):
+        keys, left, right = self.key, self.left, self.right
+        x = self.root
+        while x != NIL:
+            k = keys[x]
+            if key == k:
+                return x
+            x = left[x] if key < k else right[x]
+        return NIL
+
+    def minimum(self, x):
+        left = self.left
+        while left[x] != NIL:
+            x = left[x]
+        return x
+
+    def successor(self, x):
+        right, parent = self.right, self.parent
+        if right[x] != NIL:
+            return self.minimum(right[x])
+        y = parent[x]
+        while y != NIL and x == right[y]:
+            x = y
+            y = parent[y]
+        return y
+
+    def insert(self, key):
+        keys, left, right, parent = self.key, self.left, self.right, self.parent
+        y = NIL
+        x = self.root
+        while x != NIL:
+            y = x
+            x = left[x] if key < keys[x] else right[x]
+        z = self._new_node(key)
+        parent[z] = y
+        if y == NIL:
+            self.root = z
+        elif key < keys[y]:
+            left[y] = z
+        else:
+            right[y] = z
+        self._insert_fix(z)
+        self.n += 1
+        return z
+
+    def _insert_fix(self, z):
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        while color[parent[z]] == RED:
+            p = parent[z]
+            g = parent[p]
+            if p == left[g]:
+                y = right[g]
+                if color[y] == RED:
+                    color[p] = color[y] = BLACK
+                    color[g] = RED
+                    z = g
+                else:
+                    if z == right[p]:
+                        z = p
+                        self._rotate_left(z)
+                        p = parent[z]
+                    color[p] = BLACK
+                    color[g] = RED
+                    self._rotate_right(g)
+            else:
+                y = left[g]
+                if color[y] == RED:
+                    color[p] = color[y] = BLACK
+                    color[g] = RED
+                    z = g
+                else:
+                    if z == left[p]:
+                        z = p
+                        self._rotate_right(z)
+                        p = parent[z]
+                    color[p] = BLACK
+                    color[g] = RED
+                    self._rotate_left(g)
+        color[self.root] = BLACK
+
+    def _rotate_left(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        y = right[x]
+        right[x] = left[y]
+        if left[y] != NIL:
+            parent[left[y]] = x
+        parent[y] = parent[x]
+        if parent[x] == NIL:
+            self.root = y
+        elif x == left[parent[x]]:
+            left[parent[x]] = y
+        else:
+            right[parent[x]] = y
+        left[y] = x
+        parent[x] = y
+
+    def _rotate_right(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        y = left[x]
+        left[x] = right[y]
+        if right[y] != NIL:
+            parent[right[y]] = x
+        parent[y] = parent[x]
+        if parent[x] == NIL:
+            self.root = y
+        elif x == right[parent[x]]:
+            right[parent[x]] = y
+        else:
+            left[parent[x]] = y
+        right[y] = x
+        parent[x] = y
+
+    def _transplant(self, u, v):
+        parent = self.parent
+        if parent[u] == NIL:
+            self.root = v
+        elif u == self.left[parent[u]]:
+            self.left[parent[u]] = v
+        else:
+            self.right[parent[u]] = v
+        parent[v] = parent[u]  # may write the sentinel's parent, _delete_fix relies on it
+
+    # removes one occurrence of key, returns False if it was not present
+    def delete(self, key):
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        z = self.search(key)
+        if z == NIL:
+            return False
+        y = z
+        y_color = color[y]
+        if left[z] == NIL:
+            x = right[z]
+            self._transplant(z, x)
+        elif right[z] == NIL:
+            x = left[z]
+            self._transplant(z, x)
+        else:
+            y = self.minimum(right[z])
+            y_color = color[y]
+            x = right[y]
+            if parent[y] == z:
+                parent[x] = y
+            else:
+                self._transplant(y, right[y])
+                right[y] = right[z]
+                parent[right[y]] = y
+            self._transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            color[y] = color[z]
+        if y_color == BLACK:
+            self._delete_fix(x)
+        self.free.append(z)
+        self.n -= 1
+        return True
+
+    def _delete_fix(self, x):
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        while x != self.root and color[x] == BLACK:
+            p = parent[x]
+            if x == left[p]:
+                w = right[p]
+                if color[w] == RED:
+                    color[w] = BLACK
+                    color[p] = RED
+                    self._rotate_left(p)
+                    w = right[p]
+                if color[left[w]] == BLACK and color[right[w]] == BLACK:
+                    color[w] = RED
+                    x = p
+                else:
+                    if color[right[w]] == BLACK:
+                        color[left[w]] = BLACK
+                        color[w] = RED
+                        self._rotate_right(w)
+                        w = right[p]
+                    color[w] = color[p]
+                    color[p] = BLACK
+                    color[right[w]] = BLACK
+                    self._rotate_left(p)
+                    x = self.root
+            else:
+                w = left[p]
+                if color[w] == RED:
+                    color[w] = BLACK
+                    color[p] = RED
+                    self._rotate_right(p)
+                    w = left[p]
+                if color[right[w]] == BLACK and color[left[w]] == BLACK:
+                    color[w] = RED
+                    x = p
+                else:
+                    if color[left[w]] == BLACK:
+                        color[right[w]] = BLACK
+                        color[w] = RED
+                        self._rotate_left(w)
+                        w = left[p]
+                    color[w] = color[p]
+                    color[p] = BLACK
+                    color[left[w]] = BLACK
+                    self._rotate_right(p)
+                    x = self.root
+        color[x] = BLACK
@@ -0,0 +1,243 @@
+#WEIGHTED BIPARTITE MATCHING (assignment problem)
+#hungarian: dense cost matrix, shortest augmenting paths with row/column potentials (Jonker-Volgenant
+#style), O(n^2 m). With NumPy installed the O(m) column scan of each step is vectorised.
+#auction: sparse rows of (column, cost), Bertsekas' auction with eps-scaling; exact for integer costs.
+import random
+import time
+
+from hopcroftkarp import hopcroftKarp
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INF = float('inf')
+
+def _backend(backend):
+    if backend == "auto":
+        return "numpy" if np is not None else "python"
+    if backend == "numpy" and np is None:
+        raise ImportError("backend='numpy' needs NumPy installed")
+    if backend not in ("python", "numpy"):
+        raise ValueError("backend must be 'auto', 'python' or 'numpy'")
+    return backend
+
+# n <= m; returns col[i] for every row
+def _hungarian_python(a, n, m):
+    # row reduction gives the first row potentials
+    u = [0] + [min(row) for row in a]
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)  # p[j]: row matched to column j (1-indexed, 0 = free)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [INF] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = a[i0 - 1]
+            ui0 = u[i0]
+            delta = INF
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # flip the alternating path back to the root
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    col = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            col[p[j] - 1] = j - 1
+    return col
+
+def _hungarian_numpy(a, n, m):
+    a = np.asarray(a, dtype=float)
+    u = np.zeros(n + 1)
+    u[1:] = a.min(axis=1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, INF)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            cur = np.full(m + 1, INF)
+            cur[1:] = a[i0 - 1] - u[i0] - v[1:]
+            better = ~used & (cur < minv)
+            minv[better] = cur[better]
+            way[better] = j0
+            free = np.where(used, INF, minv)
+            j1 = int(free.argmin())
+            delta = free[j1]
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    col = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            col[p[j] - 1] = j - 1
+    return col
+
+def hungarian(cost, maximize=False, backend="auto"):
+    """cost: n x m matrix (lists or array). Returns (total, col) with col[i] the column of row i,
+    or -1 when n > m leaves row i unassigned. backend: 'auto', 'python' or 'numpy'."""
+    backend = _backend(backend)
+    a = [list(row) for row in cost]
+    n = len(a)
+    m = len(a[0]) if n else 0
+    if n == 0 or m == 0:
+        return 0, [-1] * n
+    if maximize:
+        a = [[-x for x in row] for row in a]
+    transposed = n > m
+    if transposed:
+        a = [list(col) for col in zip(*a)]
+        n, m = m, n
+    solve = _hungarian_numpy if backend == "numpy" else _hungarian_python
+    col = solve(a, n, m)
+    if transposed:
+        row_of = col
+        n, m = m, n
+        col = [-1] * n
+        for j, i in enumerate(row_of):
+            col[i] = j
+    total = sum(cost[i][j] for i, j in enumerate(col) if j != -1)
+    return total, col
+
+def auction(rows, n_cols, maximize=False, alpha=5):
+    """rows[i]: list of (column, cost) pairs, integer costs; needs len(rows) == n_cols and a perfect
+    matching (ValueError otherwise). Returns (total, col) with col[i] the column of row i."""
+    n = len(rows)
+    if n != n_cols:
+        raise ValueError("auction needs as many rows as columns; use hungarian for rectangular problems")
+    if n == 0:
+        return 0, []
+    if not all(float(c).is_integer() for row in rows for _, c in row):
+        raise ValueError("auction needs integer costs; use hungarian for fractional ones")
+    if hopcroftKarp([[j for j, _ in row] for row in rows], n_cols)[2] < n:
+        raise ValueError("no perfect matching")
+    # a column listed twice in a row keeps only its better cost
+    sign = 1 if maximize else -1
+    options = []
+    for row in rows:
+        best = {}
+        for j, c in row:
+            if j not in best or sign * c > sign * best[j]:
+                best[j] = c
+        options.append(best)
+    # benefits scaled by n + 1: a final eps of 1 is then below 1/n in original units, which is optimal
+    scale = n + 1
+    benefit = [[(j, sign * c * scale) for j, c in best.items()] for best in options]
+    values = [b for row in benefit for _, b in row]
+    spread = max(values) - min(values)
+    price = [0] * n_cols
+    owner = [-1] * n_cols
+    col = [-1] * n
+    eps = max(spread // alpha, 1)
+    while True:
+        owner = [-1] * n_cols
+        col = [-1] * n
+        unassigned = list(range(n))
+        while unassigned:
+            i = unassigned.pop()
+            # best and second best value of row i at current prices
+            best_j = -1
+            best = second = -INF
+            for j, b in benefit[i]:
+                val = b - price[j]
+                if val > best:
+                    second = best
+                    best, best_j = val, j
+                elif val > second:
+                    second = val
+            # a lone option can be raised as far as we like; spread + eps keeps prices finite
+            bid = best - second if second > -INF else spread
+            price[best_j] += bid + eps
+            k = owner[best_j]
+            if k != -1:
+                col[k] = -1
+                unassigned.append(k)
+            owner[best_j] = i
+            col[i] = best_j
+        if eps == 1:
+            break
+        eps = max(eps // alpha, 1)
+    total = sum(options[i][col[i]] for i in range(n))
+    return total, col
+
+def random_costs(n, max_cost=1000, seed=0):
+    rng = random.Random(seed)
+    return [[rng.randint(0, max_cost) for _ in range(n)] for _ in range(n)]
+
+# each row keeps `degree` random columns plus the diagonal, so a perfect matching exists
+def random_sparse(n, degree=10, max_cost=1000, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        cols = {i} | {rng.randrange(n) for _ in range(degree)}
+        rows.append([(j, rng.randint(0, max_cost)) for j in sorted(cols)])
+    return rows
+
+def benchmark(sizes=(100, 200), seed=0):
+    from mincostmaxflow import MCMF
+    for n in sizes:
+        cost = random_costs(n, seed=seed)
+        row = []
+        backends = ("python", "numpy") if np is not None else ("python",)
+        for backend in backends:
+            start = time.perf_counter()
+            total, _ = hungarian(cost, backend=backend)
+            row.append(f"hungarian/{backend} {total} in {time.perf_counter() - start:.3f}s")
+        start = time.perf_counter()
+        total, _ = auction([list(enumerate(r)) for r in cost], n)
+        row.append(f"auction {total} in {time.perf_counter() - start:.3f}s")
+        mcmf = MCMF(2 * n + 2)
+        for i in range(n):
+            mcmf.add_edge(2 * n, i, 1, 0)
+            mcmf.add_edge(n + i, 2 * n + 1, 1, 0)
+            for j in range(n):
+                mcmf.add_edge(i, n + j, 1, cost[i][j])
+        start = time.perf_counter()
+        _, total = mcmf.successiveShortestPaths(2 * n, 2 * n + 1, queue="radix")
+        row.append(f"MCMF {total} in {time.perf_counter() - start:.3f}s")
+        print(f"dense n={n}: " + ", ".join(row))
+    n = 20000
+    rows = random_sparse(n, seed=seed)
+    start = time.perf_counter()
+    total, _ = auction(rows, n)
+    print(f"sparse n={n} degree~11: auction {total} in {time.perf_counter() - start:.3f}s")
+
+if __name__ == "__main__":
+    benchmark()
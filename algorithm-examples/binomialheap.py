@@ -1,97 +1,197 @@
 #assistance from https://www.geeksforgeeks.org/dsa/binomial-heap-2/#
+import heapq
+import random
+import time
+
 class Node:
     def __init__(self, value):
         self.v = value
+        self.h = Handle(self)  # handle of the entry currently stored here
         self.p = None
-        self.children = []
+        self.children = []  # children[k] has degree k
         self.degree = 0
         self.marked = False
 
+#Returned by insert. Entries (value + handle) move between nodes while bubbling up,
+#and handle.node is updated on every move, so a handle always reaches its own value in O(1).
+class Handle:
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def value(self):
+        return self.node.v
+
+#The root list is kept as a degree-indexed array: trees[k] is the root of degree k or None,
+#so the heap is the binary representation of count and merging is binary addition.
 class BinomialHeap:
-    def __init__(self, root=None):
+    def __init__(self, root=None, lazy=False):
         self.trees = []
+        self.pending = []  # lazy mode: degree-0 roots not yet added to trees
+        self.lazy = lazy
         self.min_node = None
         self.count = 0
         if root:
-            self.trees.append(root)
+            self._add_tree(root)
             self.min_node = root
-            self.count = 1
-    
+            self.count = 1 << root.degree
+
     def __len__(self):
         return self.count
-    
+
     def is_empty(self):
         return self.min_node == None
-    
+
+    #O(1) amortized; in lazy mode O(1) worst case and the carries happen on the next extract_min
     def insert(self, value):
         node = Node(value)
-        self.merge(BinomialHeap(node))
-    
+        if self.min_node is None or value < self.min_node.v:
+            self.min_node = node
+        if self.lazy:
+            self.pending.append(node)
+        else:
+            self._add_tree(node)
+        self.count += 1
+        return node.h
+
+    #O(n): n inserts cost O(n) carries in total
+    @classmethod
+    def from_iterable(cls, values, lazy=False):
+        heap = cls(lazy=lazy)
+        for value in values:
+            heap.insert(value)
+        return heap
+
     def get_min(self):
         return self.min_node.v
-    
+
     def extract_min(self):
+        self._flush()
         min_node = self.min_node
-        self.trees.remove(min_node)
-        new_heap = BinomialHeap()
-        new_heap.trees = min_node.children
-        new_heap.count = sum(self._subtree_size(child) for child in min_node.children)
-        self.merge(new_heap)
-        self._consolidate()
-        self.count -= 1
+        if min_node is None:
+            raise IndexError("extract_min from empty heap")
+        self._remove_root(min_node)
         return min_node.v
-    
+
+    def _remove_root(self, root):
+        self.trees[root.degree] = None
+        if root is self.min_node:
+            self.min_node = None
+        for child in root.children:
+            child.p = None
+            self._add_tree(child)
+        while self.trees and self.trees[-1] is None:
+            self.trees.pop()
+        self.count -= 1
+        if self.min_node is None:
+            self._find_min()
+        root.h.node = None
+
+    #O(log n): adds the other heap's trees and leaves it empty
     def merge(self, other_heap):
-        self.trees.extend(other_heap.trees)
+        other_heap._flush()
+        if other_heap.min_node is not None and (self.min_node is None or other_heap.min_node.v < self.min_node.v):
+            self.min_node = other_heap.min_node
+        for tree in other_heap.trees:
+            if tree is not None:
+                self._add_tree(tree)
         self.count += other_heap.count
-        self._consolidate()
-    
+        other_heap.trees = []
+        other_heap.min_node = None
+        other_heap.count = 0
+
+    meld = merge
+
     def _find_min(self):
         self.min_node = None
         for tree in self.trees:
-            if self.min_node is None or tree.v < self.min_node.v:
+            if tree is not None and (self.min_node is None or tree.v < self.min_node.v):
                 self.min_node = tree
-    
-    def decrease_key(self, node, new_value):
+
+    def decrease_key(self, handle, new_value):
+        node = handle.node
         if new_value > node.v:
             raise ValueError("New value is greater than current value")
         node.v = new_value
-        self._bubble_up(node)
-    
-    def delete(self, node):
-        self.decrease_key(node, float('-inf'))
-        self.extract_min()
-    
-    def _bubble_up(self, node):
+        node = self._bubble_up(node)
+        if node.v < self.min_node.v:
+            self.min_node = node
+
+    #moves the entry to its tree's root and removes that root; no sentinel key needed
+    def delete(self, handle):
+        self._flush()
+        node = self._bubble_up(handle.node, to_root=True)
+        self._remove_root(node)
+        return node.v
+
+    #returns the node now holding the moved entry
+    def _bubble_up(self, node, to_root=False):
         parent = node.p
-        while parent is not None and node.v < parent.v:
+        while parent is not None and (to_root or node.v < parent.v):
             node.v, parent.v = parent.v, node.v
-            node, parent = parent, node
-    
+            node.h, parent.h = parent.h, node.h
+            node.h.node = node
+            parent.h.node = parent
+            node, parent = parent, parent.p
+        return node
+
     def _link(self, tree1, tree2):
-        if tree1.v > tree2.v:
+        # on ties keep the cached minimum as a root
+        if tree1.v > tree2.v or tree2 is self.min_node:
             tree1, tree2 = tree2, tree1
         tree2.p = tree1
         tree1.children.append(tree2)
         tree1.degree += 1
-    
-    def _consolidate(self):
-        degree_to_tree = {}
-
-        for current in self.trees:  # just iterate over roots
-            degree = current.degree
-            while degree in degree_to_tree:
-                other = degree_to_tree.pop(degree)
-                if current.v < other.v:
-                    self._link(current, other)
-                else:
-                    self._link(other, current)
-                degree += 1
-            degree_to_tree[degree] = current
-
-        self.trees = list(degree_to_tree.values())
-        self.min_node = min(self.trees, key=lambda t: t.v, default=None)
-
-    
-    def _subtree_size(self, node):
-        return 1 + sum(self._subtree_size(child) for child in node.children)
\ No newline at end of file
+        return tree1
+
+    #binary carry: link equal-degree roots until a free slot is found
+    def _add_tree(self, tree):
+        trees = self.trees
+        k = tree.degree
+        while True:
+            while k >= len(trees):
+                trees.append(None)
+            other = trees[k]
+            if other is None:
+                trees[k] = tree
+                return
+            trees[k] = None
+            tree = self._link(tree, other)
+            k += 1
+
+    def _flush(self):
+        if self.pending:
+            for node in self.pending:
+                self._add_tree(node)
+            self.pending = []
+
+#ns per operation for n inserts followed by n extract_mins
+def benchmark(sizes=(10**5, 10**6, 10**7), seed=0):
+    rng = random.Random(seed)
+    for n in sizes:
+        data = [rng.random() for _ in range(n)]
+        rows = []
+        for name in ("heapq", "binomial", "binomial-lazy"):
+            if name == "heapq":
+                h = []
+                start = time.perf_counter()
+                for x in data:
+                    heapq.heappush(h, x)
+                mid = time.perf_counter()
+                for _ in range(n):
+                    heapq.heappop(h)
+            else:
+                h = BinomialHeap(lazy=name == "binomial-lazy")
+                start = time.perf_counter()
+                for x in data:
+                    h.insert(x)
+                mid = time.perf_counter()
+                for _ in range(n):
+                    h.extract_min()
+            end = time.perf_counter()
+            rows.append((name, (mid - start) / n * 1e9, (end - mid) / n * 1e9))
+        for name, ins, ext in rows:
+            print(f"n={n:>9} {name:>14}: insert {ins:8.0f} ns  extract_min {ext:8.0f} ns")
+
+if __name__ == "__main__":
+    benchmark((10**5,))
@@ -0,0 +1,404 @@
+#B+ tree (see latex-notes/Advanced_Trees): all values live in the leaves, internal nodes only
+#hold separator keys, and the leaves are linked left to right so a range scan is one descent
+#followed by a sequential walk. order = max children of an internal node (max keys = order - 1).
+import mmap
+import struct
+from bisect import bisect_left, bisect_right
+
+class _Leaf:
+    def __init__(self, keys=None, values=None):
+        self.keys = keys or []
+        self.values = values or []
+        self.next = None
+
+class _Internal:
+    def __init__(self, keys=None, children=None):
+        self.keys = keys or []          # child i holds keys < keys[i] <= keys in child i+1
+        self.children = children or []
+
+def _chunk_sizes(n, cap):
+    # split n items into ceil(n/cap) groups of near-equal size, each >= ceil(cap/2) when there are 2+ groups
+    k = -(-n // cap)
+    base, extra = divmod(n, k)
+    return [base + (i < extra) for i in range(k)]
+
+class BPlusTree:
+    def __init__(self, order=64):
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order
+        self.max_keys = order - 1
+        self.min_keys = self.max_keys // 2
+        self.root = _Leaf()
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, key):
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def _find_leaf(self, key):
+        node = self.root
+        while isinstance(node, _Internal):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def get(self, key, default=None):
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return default
+
+    search = get
+
+    # lazily yields (key, value) with lo <= key < hi by walking the leaf chain
+    def range(self, lo, hi):
+        leaf = self._find_leaf(lo)
+        i = bisect_left(leaf.keys, lo)
+        while leaf is not None:
+            keys = leaf.keys
+            while i < len(keys):
+                if not keys[i] < hi:
+                    return
+                yield keys[i], leaf.values[i]
+                i += 1
+            leaf = leaf.next
+            i = 0
+
+    def items(self):
+        node = self.root
+        while isinstance(node, _Internal):
+            node = node.children[0]
+        while node is not None:
+            yield from zip(node.keys, node.values)
+            node = node.next
+
+    # inserts or overwrites key
+    def insert(self, key, value=None):
+        split = self._insert(self.root, key, value)
+        if split is not None:
+            sep, right = split
+            self.root = _Internal([sep], [self.root, right])
+
+    def _insert(self, node, key, value):
+        if isinstance(node, _Leaf):
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys) and node.keys[i] == key:
+                node.values[i] = value
+                return None
+            node.keys.insert(i, key)
+            node.values.insert(i, value)
+            self.n += 1
+            if len(node.keys) <= self.max_keys:
+                return None
+            mid = len(node.keys) // 2
+            right = _Leaf(node.keys[mid:], node.values[mid:])
+            del node.keys[mid:], node.values[mid:]
+            right.next = node.next
+            node.next = right
+            return right.keys[0], right
+        i = bisect_right(node.keys, key)
+        split = self._insert(node.children[i], key, value)
+        if split is None:
+            return None
+        sep, child = split
+        node.keys.insert(i, sep)
+        node.children.insert(i + 1, child)
+        if len(node.keys) <= self.max_keys:
+            return None
+        mid = len(node.keys) // 2
+        sep = node.keys[mid]
+        right = _Internal(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:], node.children[mid + 1:]
+        return sep, right
+
+    # removes key, returns False if it was not present
+    def delete(self, key):
+        found = self._delete(self.root, key)
+        if isinstance(self.root, _Internal) and not self.root.keys:
+            self.root = self.root.children[0]
+        return found
+
+    def _delete(self, node, key):
+        if isinstance(node, _Leaf):
+            i = bisect_left(node.keys, key)
+            if i == len(node.keys) or node.keys[i] != key:
+                return False
+            del node.keys[i], node.values[i]
+            self.n -= 1
+            return True
+        i = bisect_right(node.keys, key)
+        child = node.children[i]
+        if not self._delete(child, key):
+            return False
+        if len(child.keys) < self.min_keys:
+            self._rebalance(node, i)
+        return True
+
+    # child i of parent underflowed: borrow from a sibling that can spare a key, otherwise merge
+    def _rebalance(self, parent, i):
+        child = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+        leaf = isinstance(child, _Leaf)
+        if left is not None and len(left.keys) > self.min_keys:
+            if leaf:
+                child.keys.insert(0, left.keys.pop())
+                child.values.insert(0, left.values.pop())
+                parent.keys[i - 1] = child.keys[0]
+            else:
+                child.keys.insert(0, parent.keys[i - 1])
+                parent.keys[i - 1] = left.keys.pop()
+                child.children.insert(0, left.children.pop())
+        elif right is not None and len(right.keys) > self.min_keys:
+            if leaf:
+                child.keys.append(right.keys.pop(0))
+                child.values.append(right.values.pop(0))
+                parent.keys[i] = right.keys[0]
+            else:
+                child.keys.append(parent.keys[i])
+                parent.keys[i] = right.keys.pop(0)
+                child.children.append(right.children.pop(0))
+        else:
+            if left is None:
+                left, right, i = child, right, i + 1
+            else:
+                right = child
+            # merge right into left and drop separator i - 1
+            if leaf:
+                left.keys += right.keys
+                left.values += right.values
+                left.next = right.next
+            else:
+                left.keys.append(parent.keys[i - 1])
+                left.keys += right.keys
+                left.children += right.children
+            del parent.keys[i - 1], parent.children[i]
+
+    # O(n) bulk load from (key, value) pairs sorted by strictly increasing key
+    # fill < 1 leaves room in every leaf so that later inserts do not split immediately; 0 < fill <= 1
+    @classmethod
+    def from_sorted(cls, items, order=64, fill=1.0):
+        if not 0 < fill <= 1:
+            raise ValueError("fill must be in (0, 1]")
+        tree = cls(order)
+        keys, values = [], []
+        for k, v in items:
+            if keys and not keys[-1] < k:
+                raise ValueError("keys must be strictly increasing")
+            keys.append(k)
+            values.append(v)
+        n = len(keys)
+        if n == 0:
+            return tree
+        cap = max(2 * tree.min_keys, int(tree.max_keys * fill), 1)
+        level, lows = [], []
+        start = 0
+        for size in _chunk_sizes(n, cap):
+            leaf = _Leaf(keys[start:start + size], values[start:start + size])
+            if level:
+                level[-1].next = leaf
+            level.append(leaf)
+            lows.append(keys[start])
+            start += size
+        cap = tree.order  # children per internal node
+        while len(level) > 1:
+            parents, parent_lows = [], []
+            start = 0
+            for size in _chunk_sizes(len(level), cap):
+                parents.append(_Internal(lows[start + 1:start + size], level[start:start + size]))
+                parent_lows.append(lows[start])
+                start += size
+            level, lows = parents, parent_lows
+        tree.root = level[0]
+        tree.n = n
+        return tree
+
+    # writes the tree as a read-only page file, see PagedBPlusTree (integer keys and values only)
+    def save(self, path, page_size=4096):
+        PagedBPlusTree.build(path, self.items(), page_size)
+
+# ---------------------------
+# Page-file backend
+# Page 0 is the header, every other page is one node. Leaves are written left to right so
+# leaf p links to p + 1. Nodes store their keys (and values or child page numbers) as flat
+# int64 runs, which are read in place through memoryview casts of the mmap, so a lookup
+# touches exactly height pages and a range scan then reads consecutive leaf pages.
+# ---------------------------
+_HEADER = struct.Struct('=4sIQQQQ')  # magic, page size, root page, height, count, first leaf
+_NODE = struct.Struct('=BxxxIQ')     # is_leaf, number of keys, next leaf (0 = none)
+_MAGIC = b'BPT1'
+_INT = 8
+
+class PagedBPlusTree:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buf = memoryview(self.mm)
+        magic, self.page_size, self.root, self.height, self.n, self.first_leaf = _HEADER.unpack_from(self.buf, 0)
+        if magic != _MAGIC:
+            raise ValueError("not a B+ tree page file")
+        self.leaf_cap, self.internal_cap = self._capacities(self.page_size)
+        self.reads = 0  # pages touched since opening
+
+    def __len__(self):
+        return self.n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.buf.release()
+        self.mm.close()
+        self.file.close()
+
+    @staticmethod
+    def _capacities(page_size):
+        leaf_cap = (page_size - _NODE.size) // (2 * _INT)
+        internal_cap = (page_size - _NODE.size - _INT) // (2 * _INT)
+        if internal_cap < 2:
+            raise ValueError("page_size too small")
+        return leaf_cap, internal_cap
+
+    @classmethod
+    def build(cls, path, items, page_size=4096):
+        """Stream (key, value) int pairs sorted by strictly increasing key into a page file.
+        Only one separator per leaf is kept in memory, so the input may be larger than RAM."""
+        leaf_cap, internal_cap = cls._capacities(page_size)
+        page = bytearray(page_size)
+        with open(path, 'wb') as f:
+            f.write(bytes(page_size))  # header placeholder
+            next_page = 1
+            level = []  # (lowest key, page number) of every node on the level being built
+            count = 0
+            prev = None
+            keys, values = [], []
+
+            def write_node(is_leaf, keys, tail, cap, link):
+                page[:] = bytes(page_size)
+                _NODE.pack_into(page, 0, is_leaf, len(keys), link)
+                struct.pack_into(f'={len(keys)}q', page, _NODE.size, *keys)
+                struct.pack_into(f'={len(tail)}q', page, _NODE.size + cap * _INT, *tail)
+                f.write(page)
+
+            def flush_leaf(last):
+                nonlocal next_page
+                write_node(1, keys, values, leaf_cap, 0 if last else next_page + 1)
+                level.append((keys[0], next_page))
+                next_page += 1
+
+            for k, v in items:
+                if prev is not None and not prev < k:
+                    raise ValueError("keys must be strictly increasing")
+                prev = k
+                if len(keys) == leaf_cap:
+                    flush_leaf(False)
+                    keys, values = [], []
+                keys.append(k)
+                values.append(v)
+                count += 1
+            if keys:
+                flush_leaf(True)
+            first_leaf = 1 if count else 0
+            height = 1 if count else 0
+            while len(level) > 1:
+                parents = []
+                for start in range(0, len(level), internal_cap + 1):
+                    group = level[start:start + internal_cap + 1]
+                    write_node(0, [k for k, _ in group[1:]], [p for _, p in group], internal_cap, 0)
+                    parents.append((group[0][0], next_page))
+                    next_page += 1
+                level = parents
+                height += 1
+            root = level[0][1] if level else 0
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, page_size, root, height, count, first_leaf))
+        return cls(path)
+
+    # returns (is_leaf, keys, tail, next) where keys/tail are zero-copy int64 views into the page
+    def _node(self, p):
+        self.reads += 1
+        off = p * self.page_size
+        is_leaf, n, link = _NODE.unpack_from(self.buf, off)
+        cap = self.leaf_cap if is_leaf else self.internal_cap
+        base = off + _NODE.size
+        keys = self.buf[base:base + n * _INT].cast('q')
+        tail = self.buf[base + cap * _INT:base + cap * _INT + (n + (not is_leaf)) * _INT].cast('q')
+        return is_leaf, keys, tail, link
+
+    def _find_leaf(self, key):
+        p = self.root
+        while True:
+            is_leaf, keys, tail, link = self._node(p)
+            if is_leaf:
+                return keys, tail, link
+            p = tail[bisect_right(keys, key)]
+
+    def get(self, key, default=None):
+        if self.n == 0:
+            return default
+        keys, values, _ = self._find_leaf(key)
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return values[i]
+        return default
+
+    search = get
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    # lazily yields (key, value) with lo <= key < hi
+    def range(self, lo, hi):
+        if self.n == 0:
+            return
+        keys, values, link = self._find_leaf(lo)
+        i = bisect_left(keys, lo)
+        while True:
+            while i < len(keys):
+                if not keys[i] < hi:
+                    return
+                yield keys[i], values[i]
+                i += 1
+            if link == 0:
+                return
+            _, keys, values, link = self._node(link)
+            i = 0
+
+    def items(self):
+        if self.n == 0:
+            return
+        p = self.first_leaf
+        while p:
+            _, keys, values, p = self._node(p)
+            yield from zip(keys.tolist(), values.tolist())
+
+_MISSING = object()
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    t = BPlusTree(order=4)
+    for k in random.sample(range(100), 30):
+        t.insert(k, k * k)
+    print("range 10..30:", list(t.range(10, 30)))
+
+    n = 10**5
+    big = BPlusTree.from_sorted(((k, 2 * k) for k in range(0, 2 * n, 2)), order=128)
+    path = os.path.join(tempfile.mkdtemp(), "index.bpt")
+    big.save(path)
+    with PagedBPlusTree(path) as paged:
+        print("height", paged.height, "pages", os.path.getsize(path) // paged.page_size)
+        before = paged.reads
+        print("get(1234) =", paged.get(1234), "pages read:", paged.reads - before)
+        before = paged.reads
+        print("range sum:", sum(v for _, v in paged.range(5000, 15000)), "pages read:", paged.reads - before)
@@ -1,24 +1,28 @@
 import math
 from fibonacciheap import FibHeap
 
-def dijkstra(graph, source):
+#graph: dict of vertex -> list of (neighbour, weight). See dijkstra.py for the CSR version with other queues.
+def dijkstra(graph, source, target=None):
     dist = {v: math.inf for v in graph}
     prev = {v: None for v in graph}
     dist[source] = 0
 
     fib = FibHeap()
-    node_map = {}
-    for v in graph:
-        node_map[v] = fib.insert(dist[v], v)
+    node_map = {source: fib.insert(0, source)}
 
     while fib.n > 0:
-        u_node = fib.extract_min()
+        u_node = fib.extract_min_node()
         u = u_node.value
+        if u == target:
+            break
         for v, weight in graph[u]:
             if dist[v] > dist[u] + weight:
                 dist[v] = dist[u] + weight
                 prev[v] = u
-                fib.decrease_key(node_map[v], dist[v])
+                # insert on first discovery instead of pre-inserting every vertex
+                if v in node_map:
+                    fib.decrease_key(node_map[v], dist[v])
+                else:
+                    node_map[v] = fib.insert(dist[v], v)
 
-
-    return dist, prev
\ No newline at end of file
+    return dist, prev
@@ -0,0 +1,236 @@
+#Dijkstra over a CSR graph with pluggable priority queues
+#Vertices enter the queue when first discovered (not all up front) and the search stops once target is settled.
+import heapq
+import math
+import random
+import time
+from array import array
+
+from binomialheap import BinomialHeap
+from fibonacciheap import ArrayFibHeap, FibHeap
+from pairingheap import PairingHeap
+from radixheap import RadixHeap
+
+INF = math.inf
+
+#Compressed sparse row graph: the out-edges of u are targets/weights[offsets[u]:offsets[u+1]]
+class CSRGraph:
+    def __init__(self, n, offsets, targets, weights):
+        self.n = n
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.integral = weights.typecode == 'q'
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        """edges: iterable of (u, v, w) with w >= 0"""
+        edges = list(edges)
+        integral = all(isinstance(w, int) for _, _, w in edges)
+        offsets = array('q', [0] * (n + 1))
+        for u, _, w in edges:
+            if w < 0:
+                raise ValueError("Dijkstra requires non-negative edge weights")
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+        targets = array('q', [0] * len(edges))
+        weights = array('q' if integral else 'd', [0] * len(edges))
+        fill = offsets[:-1]
+        for u, v, w in edges:
+            i = fill[u]
+            targets[i] = v
+            weights[i] = w
+            fill[u] = i + 1
+        return cls(n, offsets, targets, weights)
+
+    @classmethod
+    def from_adjacency(cls, adj):
+        """adj: list where adj[u] is a list of (v, w)"""
+        return cls.from_edges(len(adj), ((u, v, w) for u in range(len(adj)) for v, w in adj[u]))
+
+# ---------------------------
+# Queue adapters
+# push(v, d) on first discovery, decrease(v, d) on improvement, pop() -> (d, v)
+# Lazy queues push a duplicate on decrease; dijkstra skips the stale entries.
+# ---------------------------
+class HeapqQueue:
+    def __init__(self, n):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, v, d):
+        heapq.heappush(self.heap, (d, v))
+
+    decrease = push
+
+    def pop(self):
+        return heapq.heappop(self.heap)
+
+class FibQueue:
+    def __init__(self, n):
+        self.heap = FibHeap()
+        self.handle = [None] * n
+
+    def __len__(self):
+        return self.heap.n
+
+    def push(self, v, d):
+        self.handle[v] = self.heap.insert(d, v)
+
+    def decrease(self, v, d):
+        self.heap.decrease_key(self.handle[v], d)
+
+    def pop(self):
+        node = self.heap.extract_min_node()
+        return node.key, node.value
+
+class ArrayFibQueue:
+    def __init__(self, n):
+        self.heap = ArrayFibHeap()
+        self.handle = array('q', [0] * n)
+        self.vertex = array('q')
+
+    def __len__(self):
+        return self.heap.n
+
+    def push(self, v, d):
+        self.handle[v] = self.heap.insert(d)
+        self.vertex.append(v)
+
+    def decrease(self, v, d):
+        self.heap.decrease_key(self.handle[v], d)
+
+    def pop(self):
+        h = self.heap.extract_min_handle()
+        return self.heap.key[h], self.vertex[h]
+
+class BinomialQueue:
+    def __init__(self, n):
+        self.heap = BinomialHeap()
+        self.handle = [None] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, v, d):
+        self.handle[v] = self.heap.insert((d, v))
+
+    def decrease(self, v, d):
+        self.heap.decrease_key(self.handle[v], (d, v))
+
+    def pop(self):
+        return self.heap.extract_min()
+
+class PairingQueue:
+    def __init__(self, n):
+        self.heap = PairingHeap()
+        self.handle = [None] * n
+
+    def __len__(self):
+        return self.heap.n
+
+    def push(self, v, d):
+        self.handle[v] = self.heap.insert(d, v)
+
+    def decrease(self, v, d):
+        self.heap.decrease_key(self.handle[v], d)
+
+    def pop(self):
+        node = self.heap.extract_min_node()
+        return node.key, node.value
+
+class RadixQueue:
+    def __init__(self, n):
+        self.heap = RadixHeap()
+
+    def __len__(self):
+        return self.heap.n
+
+    def push(self, v, d):
+        self.heap.push(d, v)
+
+    decrease = push
+
+    def pop(self):
+        return self.heap.pop()
+
+QUEUES = {
+    "heapq": HeapqQueue,
+    "fib": FibQueue,
+    "arrayfib": ArrayFibQueue,
+    "binomial": BinomialQueue,
+    "pairing": PairingQueue,
+    "radix": RadixQueue,
+}
+
+def dijkstra(graph, source, target=None, queue="heapq"):
+    """
+    Single-source shortest paths on a CSRGraph.
+    - queue: key of QUEUES; "radix" needs integer weights
+    - target: if given, stop as soon as it is settled (other distances may be upper bounds)
+    Returns (dist, prev) lists with INF / -1 for unreached vertices.
+    """
+    if queue == "radix" and not graph.integral:
+        raise ValueError("radix queue requires integer weights")
+    n = graph.n
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = [INF] * n
+    prev = [-1] * n
+    q = QUEUES[queue](n)
+    dist[source] = 0
+    q.push(source, 0)
+    while q:
+        d, u = q.pop()
+        if d > dist[u]:
+            continue  # stale duplicate from a lazy queue
+        if u == target:
+            break
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            nd = d + weights[i]
+            if nd < dist[v]:
+                if dist[v] == INF:
+                    q.push(v, nd)
+                else:
+                    q.decrease(v, nd)
+                dist[v] = nd
+                prev[v] = u
+    return dist, prev
+
+def path_to(prev, target):
+    path = []
+    while target != -1:
+        path.append(target)
+        target = prev[target]
+    return path[::-1]
+
+def random_graph(n, m, max_w=1000, seed=0):
+    rng = random.Random(seed)
+    edges = [(i, i + 1, rng.randint(1, max_w)) for i in range(n - 1)]  # keep it connected from 0
+    edges += [(rng.randrange(n), rng.randrange(n), rng.randint(0, max_w)) for _ in range(m - len(edges))]
+    return CSRGraph.from_edges(n, edges)
+
+def benchmark(n=10**5, m=5 * 10**5, queues=None, seed=0):
+    graph = random_graph(n, m, seed=seed)
+    results = {}
+    reference = None
+    for name in queues or QUEUES:
+        start = time.perf_counter()
+        dist, _ = dijkstra(graph, 0, queue=name)
+        results[name] = time.perf_counter() - start
+        if reference is None:
+            reference = dist
+        assert dist == reference, name
+        print(f"{name:>9}: {results[name]:.3f}s")
+    return results
+
+if __name__ == "__main__":
+    adj = [[(1, 4), (2, 1)], [(3, 1)], [(1, 2), (3, 5)], []]
+    g = CSRGraph.from_adjacency(adj)
+    for name in QUEUES:
+        dist, prev = dijkstra(g, 0, queue=name)
+        print(name, dist, path_to(prev, 3))
+    benchmark(5000, 25000)
@@ -0,0 +1,101 @@
+#Dinic's maximum flow: O(V^2 E) in general, O(E sqrt(V)) on unit networks
+#Runs on a FlowGraph (flowgraph.py); edge e's reverse is e ^ 1.
+from collections import deque
+
+from flowgraph import FlowGraph
+
+class Dinic:
+    # graph: a FlowGraph to run on (its flow is updated in place), or a vertex count for a new one
+    def __init__(self, graph):
+        if isinstance(graph, int):
+            graph = FlowGraph(graph)
+        self.graph = graph
+        self.n = graph.n
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        """edges: iterable of (u, v, capacity)"""
+        return cls(FlowGraph.from_edges(n, edges))
+
+    # returns the id of the forward edge
+    def add_edge(self, u, v, cap):
+        return self.graph.add_edge(u, v, cap)
+
+    def flow(self, e):
+        return self.graph.flow[e]
+
+    # level graph by BFS from s over residual edges, returns None once t is unreachable
+    def _bfs(self, s, t):
+        g = self.graph
+        head, adj, to, cap, flow = g.head, g.adj, g.to, g.cap, g.flow
+        level = [-1] * self.n
+        level[s] = 0
+        q = deque([s])
+        while q:
+            u = q.popleft()
+            for i in range(head[u], head[u + 1]):
+                e = adj[i]
+                v = to[e]
+                if level[v] < 0 and cap[e] > flow[e]:
+                    level[v] = level[u] + 1
+                    q.append(v)
+        return level if level[t] >= 0 else None
+
+    # blocking flow with an explicit path stack and current-arc pointers it[u]
+    def _blocking_flow(self, s, t, level):
+        g = self.graph
+        head, adj, to, cap, flow = g.head, g.adj, g.to, g.cap, g.flow
+        it = list(head[:-1]) if self.n else []
+        total = 0
+        path = []
+        u = s
+        while True:
+            if u == t:
+                f = min(cap[e] - flow[e] for e in path)
+                for e in path:
+                    flow[e] += f
+                    flow[e ^ 1] -= f
+                total += f
+                # retreat to the tail of the first saturated edge
+                k = 0
+                while cap[path[k]] > flow[path[k]]:
+                    k += 1
+                del path[k:]
+                u = to[path[-1]] if path else s
+                continue
+            i = it[u]
+            end = head[u + 1]
+            lu = level[u] + 1
+            while i < end:
+                e = adj[i]
+                if cap[e] > flow[e] and level[to[e]] == lu:
+                    break
+                i += 1
+            it[u] = i
+            if i < end:
+                e = adj[i]
+                path.append(e)
+                u = to[e]
+            else:
+                # dead end: drop u from the level graph and back up one edge
+                level[u] = -1
+                if not path:
+                    return total
+                e = path.pop()
+                u = to[e ^ 1]
+                it[u] += 1
+
+    def max_flow(self, s, t):
+        self.s = s
+        if s == t:
+            return 0
+        total = 0
+        while True:
+            level = self._bfs(s, t)
+            if level is None:
+                return total
+            total += self._blocking_flow(s, t, level)
+
+    # (source side, cut edges as (u, v, cap)) of the last max_flow
+    def min_cut(self):
+        return self.graph.min_cut(self.s)
@@ -1,18 +1,34 @@
-from collections import defaultdict
+from collections import deque
+
+from dinic import Dinic
 
 #MAXIMUM FLOW
+#FlowNetwork keeps its original dense-matrix interface, but FordFulkerson now runs Dinic on
+#adjacency lists built from the non-zero entries. Use from_edges for sparse networks so the
+#n x n matrix is never built.
 class FlowNetwork:
     def __init__(self, graph):
         self.graph = graph  # residual graph
         self.ROW = len(graph)
-    
+        self.dinic = None
+
+    @classmethod
+    def from_edges(cls, n, edges):
+        """edges: iterable of (u, v, capacity); memory is O(V + E). The residual is kept across
+        calls, like the matrix of a dense network."""
+        net = cls.__new__(cls)
+        net.graph = None
+        net.ROW = n
+        net.dinic = Dinic.from_edges(n, edges)
+        return net
+
     def BFS(self,s,t,parent):
         visited = [False] * self.ROW
-        q = []
+        q = deque()
         q.append(s)
         visited[s] = True
         while q:
-            u = q.pop(0)
+            u = q.popleft()
             for ind, val in enumerate(self.graph[u]):
                 if visited[ind] == False and val > 0:
                     q.append(ind)
@@ -21,25 +37,34 @@ class FlowNetwork:
                     if ind == t:
                         return True
         return False
-    
+
     #https://www.geeksforgeeks.org/dsa/ford-fulkerson-algorithm-for-maximum-flow-problem/#
+    #Same signature and residual-matrix side effect as before, computed with Dinic
     def FordFulkerson(self, source, sink):
-        parent = [-1]*(self.ROW)
-        max_flow = 0 # There is no flow initially
-
-        while self.BFS(source, sink, parent):
-            path_flow = float("Inf")
-            s = sink
-            while(s !=  source):
-                path_flow = min(path_flow, self.graph[parent[s]][s])
-                s = parent[s]
-            max_flow +=  path_flow
-
-            v = sink
-            while(v !=  source):
-                u = parent[v]
-                self.graph[u][v] -= path_flow
-                self.graph[v][u] += path_flow
-                v = parent[v]
-
-        return max_flow
\ No newline at end of file
+        self.source = source
+        if self.graph is None:
+            return self.dinic.max_flow(source, sink)
+
+        n = self.ROW
+        dinic = Dinic(n)
+        for u in range(n):
+            for v, c in enumerate(self.graph[u]):
+                if c > 0:
+                    dinic.add_edge(u, v, c)
+        max_flow = dinic.max_flow(source, sink)
+
+        # residual[u][v] = c(u,v) - f(u,v) + f(v,u)
+        residual = [[0] * n for _ in range(n)]
+        for u, v, c, f in dinic.graph.edges():
+            residual[u][v] += c - f
+            residual[v][u] += f
+        for u in range(n):
+            self.graph[u][:] = residual[u]
+        self.dinic = dinic
+        return max_flow
+
+    max_flow = FordFulkerson
+
+    # (source side, cut edges as (u, v, capacity)) of the last FordFulkerson call
+    def min_cut(self):
+        return self.dinic.min_cut()
@@ -1,9 +1,11 @@
 #assistance from https://github.com/woodfrog/FibonacciHeap
 import math
+from array import array
 
 class FibHeapNode:
-    def __init__(self, key):
+    def __init__(self, key, value=None):
         self.key = key
+        self.value = value
         self.degree = 0
         self.parent = None
         self.child = None
@@ -16,8 +18,8 @@ class FibHeap:
         self.min = None
         self.n = 0
 
-    def insert(self, key):
-        node = FibHeapNode(key)
+    def insert(self, key, value=None):
+        node = FibHeapNode(key, value)
         if not self.min:
             self.min = node
         else:
@@ -27,6 +29,40 @@ class FibHeap:
         self.n += 1
         return node
 
+    #O(n): every key goes straight onto the root list, the first extract_min consolidates
+    @classmethod
+    def from_iterable(cls, keys):
+        heap = cls()
+        for key in keys:
+            node = FibHeapNode(key)
+            if not heap.min:
+                heap.min = node
+            else:
+                heap._add_to_root_list(node)
+                if key < heap.min.key:
+                    heap.min = node
+            heap.n += 1
+        return heap
+
+    #O(1): splice the other root list into ours, other is left empty
+    def meld(self, other):
+        if not other.min:
+            return
+        if not self.min:
+            self.min = other.min
+        else:
+            a, b = self.min, other.min
+            a_right, b_left = a.right, b.left
+            a.right = b
+            b.left = a
+            a_right.left = b_left
+            b_left.right = a_right
+            if b.key < a.key:
+                self.min = b
+        self.n += other.n
+        other.min = None
+        other.n = 0
+
     def _add_to_root_list(self, node):
         node.left = self.min
         node.right = self.min.right
@@ -37,6 +73,11 @@ class FibHeap:
         return self.min.key if self.min else None
 
     def extract_min(self):
+        z = self.extract_min_node()
+        return z.key if z else None
+
+    # same as extract_min but returns the removed node (key and value)
+    def extract_min_node(self):
         z = self.min
         if z:
             if z.child:
@@ -58,10 +99,11 @@ class FibHeap:
                 self.min = z.right
                 self._consolidate()
             self.n -= 1
-        return z.key if z else None
+        return z
 
     def _consolidate(self):
-        A = [None] * int(math.log(self.n, 2) + 2)
+        # max degree is bounded by log_phi(n) ~ 1.44 log2(n)
+        A = [None] * (int(math.log(self.n, 2) * 1.45) + 2)
         roots = []
         x = self.min
         while True:
@@ -79,6 +121,8 @@ class FibHeap:
                 self._heap_link(y, x)
                 A[d] = None
                 d += 1
+                if d == len(A):
+                    A.append(None)
             A[d] = x
         self.min = None
         for a in A:
@@ -139,6 +183,170 @@ class FibHeap:
                 self._cut(y, z)
                 self._cascading_cut(z)
 
+# Array-backed variant: one slot per key in parallel typed arrays instead of a
+# FibHeapNode object per key. insert returns an integer handle (the slot index)
+# which stays valid for decrease_key until that key is extracted. Slots are
+# never reused, so handles are unique for the life of the heap.
+NIL = -1
+
+class ArrayFibHeap:
+    def __init__(self):
+        self.key = array('d')
+        self.degree = array('i')
+        self.parent = array('i')
+        self.child = array('i')
+        self.left = array('i')
+        self.right = array('i')
+        self.mark = array('b')
+        self.min = NIL
+        self.n = 0
+
+    def insert(self, key):
+        x = len(self.key)
+        self.key.append(key)
+        self.degree.append(0)
+        self.parent.append(NIL)
+        self.child.append(NIL)
+        self.left.append(x)
+        self.right.append(x)
+        self.mark.append(0)
+        if self.min == NIL:
+            self.min = x
+        else:
+            self._add_to_root_list(x)
+            if key < self.key[self.min]:
+                self.min = x
+        self.n += 1
+        return x
+
+    def _add_to_root_list(self, x):
+        left, right, m = self.left, self.right, self.min
+        left[x] = m
+        right[x] = right[m]
+        left[right[m]] = x
+        right[m] = x
+
+    def find_min(self):
+        return self.key[self.min] if self.min != NIL else None
+
+    def extract_min(self):
+        z = self.extract_min_handle()
+        return self.key[z] if z != NIL else None
+
+    # same as extract_min but returns the handle of the removed key
+    def extract_min_handle(self):
+        z = self.min
+        if z == NIL:
+            return NIL
+        left, right, parent = self.left, self.right, self.parent
+        x = self.child[z]
+        if x != NIL:
+            children = []
+            while True:
+                children.append(x)
+                x = right[x]
+                if x == self.child[z]:
+                    break
+            for c in children:
+                self._add_to_root_list(c)
+                parent[c] = NIL
+            self.child[z] = NIL
+        right[left[z]] = right[z]
+        left[right[z]] = left[z]
+        if z == right[z]:
+            self.min = NIL
+        else:
+            self.min = right[z]
+            self._consolidate()
+        left[z] = right[z] = z
+        self.n -= 1
+        return z
+
+    def _consolidate(self):
+        key, degree, left, right = self.key, self.degree, self.left, self.right
+        A = [NIL] * (int(math.log(self.n, 2) * 1.45) + 2)
+        roots = []
+        x = self.min
+        while True:
+            roots.append(x)
+            x = right[x]
+            if x == self.min:
+                break
+        for x in roots:
+            d = degree[x]
+            while A[d] != NIL:
+                y = A[d]
+                if key[x] > key[y]:
+                    x, y = y, x
+                self._heap_link(y, x)
+                A[d] = NIL
+                d += 1
+                if d == len(A):
+                    A.append(NIL)
+            A[d] = x
+        self.min = NIL
+        for a in A:
+            if a != NIL:
+                if self.min == NIL:
+                    self.min = a
+                    left[a] = right[a] = a
+                else:
+                    self._add_to_root_list(a)
+                    if key[a] < key[self.min]:
+                        self.min = a
+
+    def _heap_link(self, y, x):
+        left, right, child = self.left, self.right, self.child
+        right[left[y]] = right[y]
+        left[right[y]] = left[y]
+        self.parent[y] = x
+        c = child[x]
+        if c == NIL:
+            child[x] = y
+            left[y] = right[y] = y
+        else:
+            left[y] = c
+            right[y] = right[c]
+            left[right[c]] = y
+            right[c] = y
+        self.degree[x] += 1
+        self.mark[y] = 0
+
+    def decrease_key(self, x, k):
+        if k > self.key[x]:
+            raise ValueError("new key is greater than current key")
+        self.key[x] = k
+        y = self.parent[x]
+        if y != NIL and k < self.key[y]:
+            self._cut(x, y)
+            self._cascading_cut(y)
+        if k < self.key[self.min]:
+            self.min = x
+
+    def _cut(self, x, y):
+        left, right = self.left, self.right
+        if right[x] == x:
+            self.child[y] = NIL
+        else:
+            left[right[x]] = left[x]
+            right[left[x]] = right[x]
+            if self.child[y] == x:
+                self.child[y] = right[x]
+        self.degree[y] -= 1
+        self._add_to_root_list(x)
+        self.parent[x] = NIL
+        self.mark[x] = 0
+
+    # iterative so long mark chains cannot hit the recursion limit
+    def _cascading_cut(self, y):
+        z = self.parent[y]
+        while z != NIL:
+            if not self.mark[y]:
+                self.mark[y] = 1
+                return
+            self._cut(y, z)
+            y, z = z, self.parent[z]
+
 def main():
     fib = FibHeap()
     a = fib.insert(10)
@@ -0,0 +1,151 @@
+#Struct-of-arrays residual graph shared by the flow solvers (dinic.py, edmondskarp.py,
+#pushrelabel.py, mincostmaxflow.py). Edges are added in pairs, so edge e's reverse is e ^ 1
+#and its tail is to[e ^ 1]. Per edge we store one int64 each of to/cap/flow/cost plus one
+#adjacency slot, instead of a Python object with a dict. Capacities or costs that do not fit
+#int64 (floats, inf, huge ints) switch cap/flow/cost to plain lists, as the original solvers used.
+#  residual(e) = cap[e] - flow[e], flow[e ^ 1] == -flow[e], cost[e ^ 1] == -cost[e]
+#The out-edges of u are adj[head[u]:head[u + 1]] (CSR), built on first use after edges change.
+#Solvers only write flow[], so one built graph can be handed to several algorithms in turn
+#(call reset() in between).
+from array import array
+from collections import deque
+
+class FlowGraph:
+    def __init__(self, n, typecode=None):
+        """typecode: None to pick storage from the data (int64 arrays, or lists once a value does not
+        fit), 'q' for int64 or 'd' for float arrays only"""
+        self.n = n
+        self.typecode = typecode
+        self.to = array('q')
+        self.cap = array(typecode or 'q')
+        self.flow = array(typecode or 'q')
+        self.cost = array(typecode or 'q')
+        self._head = None
+        self._adj = None
+
+    @classmethod
+    def from_edges(cls, n, edges, typecode=None):
+        """edges: iterable of (u, v, capacity) or (u, v, capacity, cost)"""
+        g = cls(n, typecode)
+        for edge in edges:
+            g.add_edge(*edge)
+        return g
+
+    def __len__(self):
+        return len(self.to)
+
+    # returns the id of the forward edge
+    def add_edge(self, u, v, cap, cost=0):
+        e = len(self.to)
+        try:
+            self._append(cap, cost)
+        except (TypeError, OverflowError):
+            del self.cap[e:], self.flow[e:], self.cost[e:]
+            if self.typecode is not None:
+                raise
+            self.cap, self.flow, self.cost = list(self.cap), list(self.flow), list(self.cost)
+            self._append(cap, cost)
+        self.to.append(v)
+        self.to.append(u)
+        self._head = None
+        return e
+
+    def _append(self, cap, cost):
+        self.cap.append(cap)
+        self.flow.append(0)
+        self.cost.append(cost)
+        self.cap.append(0)
+        self.flow.append(0)
+        self.cost.append(-cost)
+
+    # cost scaling and the radix queue need integer costs
+    def integral_costs(self):
+        if isinstance(self.cost, array):
+            return self.cost.typecode == 'q'
+        return all(isinstance(c, int) for c in self.cost)
+
+    def _build(self):
+        n, to = self.n, self.to
+        head = array('q', bytes(8 * (n + 1)))
+        for e in range(len(to)):
+            head[to[e ^ 1] + 1] += 1
+        for u in range(n):
+            head[u + 1] += head[u]
+        fill = head[:-1]
+        adj = array('q', bytes(8 * len(to)))
+        for e in range(len(to)):
+            u = to[e ^ 1]
+            adj[fill[u]] = e
+            fill[u] += 1
+        self._head, self._adj = head, adj
+
+    @property
+    def head(self):
+        if self._head is None:
+            self._build()
+        return self._head
+
+    @property
+    def adj(self):
+        if self._head is None:
+            self._build()
+        return self._adj
+
+    def tail(self, e):
+        return self.to[e ^ 1]
+
+    def residual(self, e):
+        return self.cap[e] - self.flow[e]
+
+    def out_edges(self, u):
+        head = self.head
+        return self._adj[head[u]:head[u + 1]]
+
+    # zero the flow in place so solvers holding this graph see it
+    def reset(self):
+        if isinstance(self.flow, array):
+            self.flow[:] = array(self.flow.typecode, bytes(len(self.flow) * self.flow.itemsize))
+        else:
+            self.flow[:] = [0] * len(self.flow)
+
+    # overwrite the flow from a list; like add_edge, falls back to lists for flows the array cannot hold
+    def set_flow(self, flow):
+        if isinstance(self.flow, array):
+            try:
+                self.flow[:] = array(self.flow.typecode, flow)
+                return
+            except (TypeError, OverflowError):
+                if self.typecode is not None:
+                    raise
+                self.cap, self.cost = list(self.cap), list(self.cost)
+        self.flow = list(flow)
+
+    # vertices reachable from s over residual edges; after a max flow this is the source side of a min cut
+    def reachable(self, s):
+        head, adj, to, cap, flow = self.head, self._adj, self.to, self.cap, self.flow
+        seen = bytearray(self.n)
+        seen[s] = 1
+        q = deque([s])
+        while q:
+            u = q.popleft()
+            for i in range(head[u], head[u + 1]):
+                e = adj[i]
+                v = to[e]
+                if not seen[v] and cap[e] > flow[e]:
+                    seen[v] = 1
+                    q.append(v)
+        return seen
+
+    # (source side, cut edges as (u, v, cap)) from the residual graph left by a max flow from s
+    def min_cut(self, s):
+        seen = self.reachable(s)
+        to, cap = self.to, self.cap
+        cut = [(to[e + 1], to[e], cap[e]) for e in range(0, len(to), 2)
+               if seen[to[e + 1]] and not seen[to[e]] and cap[e] > 0]
+        return [v for v in range(self.n) if seen[v]], cut
+
+    # forward edges as (u, v, cap, flow)
+    def edges(self):
+        to, cap, flow = self.to, self.cap, self.flow
+        for e in range(0, len(to), 2):
+            yield to[e + 1], to[e], cap[e], flow[e]
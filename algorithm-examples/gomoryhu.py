@@ -0,0 +1,132 @@
+#Gomory-Hu tree of an undirected capacitated graph by Gusfield's algorithm: n - 1 max-flow
+#computations (Dinic on a FlowGraph) instead of one per pair. The minimum u-v cut of the graph
+#equals the lightest edge on the u-v path in the tree.
+#
+#Iteration s cuts s from parent[s] and may re-hang later vertices, so the flows are not independent.
+#With workers > 1 the next `workers` pairs (s, parent[s]) are solved speculatively in a process pool;
+#a result is used only if parent[s] is still the same when its turn comes, otherwise that pair is
+#solved again in the next batch. The cut between a fixed pair does not depend on the tree built
+#so far, so speculation never changes the answer.
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dinic import Dinic
+from flowgraph import FlowGraph
+
+_graph = None  # per-process graph for pool workers
+
+def _build(n, edges):
+    g = FlowGraph(n)
+    for u, v, c in edges:
+        g.add_edge(u, v, c)
+        g.add_edge(v, u, c)
+    return g
+
+def _init_worker(n, edges):
+    global _graph
+    _graph = _build(n, edges)
+
+# min s-t cut on g: (value, bytearray marking the side of s)
+def _cut(g, s, t):
+    g.reset()
+    value = Dinic(g).max_flow(s, t)
+    return value, g.reachable(s)
+
+def _worker_cut(pair):
+    return _cut(_graph, *pair)
+
+class GomoryHuTree:
+    def __init__(self, n, edges, workers=1):
+        """edges: iterable of undirected (u, v, capacity); workers > 1 solves flows in a process pool"""
+        self.n = n
+        edges = list(edges)
+        self.parent = [0] * n
+        self.weight = [0] * n  # weight[v]: capacity of tree edge v - parent[v]; unused for v = 0
+        self.flows = 0  # max-flow computations run, including discarded speculative ones
+        if workers > 1 and n > 2:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(n, edges)) as pool:
+                self._build_parallel(pool, workers)
+        else:
+            g = _build(n, edges)
+            for s in range(1, n):
+                self._apply(s, *_cut(g, s, self.parent[s]))
+                self.flows += 1
+        self._depth = None
+
+    # Gusfield's update with the cut (value, side of s) between s and t = parent[s]
+    def _apply(self, s, value, side):
+        parent, weight = self.parent, self.weight
+        t = parent[s]
+        weight[s] = value
+        for v in range(self.n):
+            if v != s and side[v] and parent[v] == t:
+                parent[v] = s
+        if side[parent[t]]:
+            parent[s] = parent[t]
+            parent[t] = s
+            weight[s] = weight[t]
+            weight[t] = value
+
+    def _build_parallel(self, pool, workers):
+        s = 1
+        while s < self.n:
+            batch = list(range(s, min(s + workers, self.n)))
+            pairs = [(v, self.parent[v]) for v in batch]
+            results = list(pool.map(_worker_cut, pairs))
+            self.flows += len(batch)
+            for (v, t), result in zip(pairs, results):
+                if self.parent[v] != t:
+                    break  # an earlier cut in this batch re-hung v; redo from v
+                self._apply(v, *result)
+                s = v + 1
+
+    # tree edges as (v, parent[v], weight)
+    def edges(self):
+        return [(v, self.parent[v], self.weight[v]) for v in range(1, self.n)]
+
+    # min u-v cut value: lightest edge on the tree path
+    def min_cut(self, u, v):
+        if u == v:
+            return float('inf')
+        if self._depth is None:
+            self._depth = [-1] * self.n
+            self._depth[0] = 0
+            for x in range(1, self.n):
+                path = []
+                while self._depth[x] < 0:
+                    path.append(x)
+                    x = self.parent[x]
+                for y in reversed(path):
+                    self._depth[y] = self._depth[self.parent[y]] + 1
+        depth, parent, weight = self._depth, self.parent, self.weight
+        best = float('inf')
+        while u != v:
+            if depth[u] < depth[v]:
+                u, v = v, u
+            best = min(best, weight[u])
+            u = parent[u]
+        return best
+
+    # n x n matrix of min cut values, inf on the diagonal
+    def all_pairs(self):
+        return [[self.min_cut(u, v) for v in range(self.n)] for u in range(self.n)]
+
+def random_graph(n, m, max_cap=100, seed=0):
+    rng = random.Random(seed)
+    edges = [(v, rng.randrange(v), rng.randint(1, max_cap)) for v in range(1, n)]  # connected
+    while len(edges) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append((u, v, rng.randint(1, max_cap)))
+    return edges
+
+def benchmark(n=300, m=3000, workers=(1, 4), seed=0):
+    edges = random_graph(n, m, seed=seed)
+    for w in workers:
+        start = time.perf_counter()
+        tree = GomoryHuTree(n, edges, workers=w)
+        print(f"V={n} E={m} workers={w}: {tree.flows} flows in {time.perf_counter() - start:.3f}s")
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,66 +1,303 @@
 import heapq
+import random
+import time
+from collections import deque
+
+from dinic import Dinic
+from flowgraph import FlowGraph
+from radixheap import RadixHeap
+
 #MINIMUM COST MAXIMUM FLOW
-class MCMF: 
-    def __init__(self,N): 
-        self.graph = [[] for _ in range(N)]
-        self.N = N
+#Edges live in a FlowGraph (flowgraph.py): to/cap/flow/cost arrays, reverse of e is e ^ 1
+#Successive shortest paths with Johnson potentials; negative costs are allowed as long as
+#there is no negative cycle. solve(method="cost_scaling") runs cost-scaling push-relabel
+#instead, whose running time does not grow with the amount of flow.
+class MCMF:
+    # N: vertex count, or an existing FlowGraph to run on (its flow is updated in place)
+    def __init__(self,N):
+        self.graph = N if isinstance(N, FlowGraph) else FlowGraph(N)
+        self.N = self.graph.n
 
     def add_edge(self, u, v, capacity, cost):
-        #edge, capacity, cost, index of the reverse edge in the opposite node’s adjacency list.
-        self.graph[u].append([v, capacity, cost, len(self.graph[v])])
-        self.graph[v].append([u, 0, -cost, len(self.graph[u])-1])
-    
-    def successiveShortestPaths(self, source, sink, max_flow=float('inf')):
+        return self.graph.add_edge(u, v, capacity, cost)
+
+    # Shortest distances from source over residual edges, used as the first potentials so that
+    # every reduced cost cost[e] + h[u] - h[v] is >= 0 even with negative costs. Topological order
+    # when the residual graph is acyclic, otherwise SPFA (queue-based Bellman-Ford).
+    # Vertices unreachable from source get 0; they stay unreachable.
+    def _initial_potentials(self, source):
         N = self.N
-        prevv = [0] * N
-        preve = [0] * N
+        g = self.graph
+        head, adj, to, cap, flow, cost = g.head, g.adj, g.to, g.cap, g.flow, g.cost
+        if all(cost[e] >= 0 for e in range(len(to)) if cap[e] > flow[e]):
+            return [0] * N
+        INF = float('inf')
+        dist = [INF] * N
+        dist[source] = 0
+
+        indeg = [0] * N
+        for e in range(len(to)):
+            if cap[e] > flow[e]:
+                indeg[to[e]] += 1
+        order = [u for u in range(N) if indeg[u] == 0]
+        for u in order:
+            for i in range(head[u], head[u + 1]):
+                e = adj[i]
+                if cap[e] > flow[e]:
+                    v = to[e]
+                    indeg[v] -= 1
+                    if indeg[v] == 0:
+                        order.append(v)
+        if len(order) == N:
+            for u in order:
+                if dist[u] < INF:
+                    for i in range(head[u], head[u + 1]):
+                        e = adj[i]
+                        if cap[e] > flow[e] and dist[u] + cost[e] < dist[to[e]]:
+                            dist[to[e]] = dist[u] + cost[e]
+        else:
+            queue = deque([source])
+            in_queue = [False] * N
+            in_queue[source] = True
+            passes = [0] * N
+            while queue:
+                u = queue.popleft()
+                in_queue[u] = False
+                passes[u] += 1
+                if passes[u] > N:
+                    raise ValueError("negative-cost cycle reachable from the source")
+                du = dist[u]
+                for i in range(head[u], head[u + 1]):
+                    e = adj[i]
+                    if cap[e] > flow[e]:
+                        v = to[e]
+                        if du + cost[e] < dist[v]:
+                            dist[v] = du + cost[e]
+                            if not in_queue[v]:
+                                in_queue[v] = True
+                                queue.append(v)
+        return [d if d < INF else 0 for d in dist]
+
+    # queue: "heapq", or "radix" for integer costs (reduced costs are then non-negative integers
+    # and Dijkstra's keys are monotone)
+    def successiveShortestPaths(self, source, sink, max_flow=float('inf'), queue="heapq"):
+        if queue not in ("heapq", "radix"):
+            raise ValueError("queue must be 'heapq' or 'radix'")
+        N = self.N
+        g = self.graph
+        radix = queue == "radix"
+        if radix and not g.integral_costs():
+            raise ValueError("the radix queue needs integer costs")
+        # list copies for the hot loop (indexing an array boxes a new int each time); flow is written back
+        head, adj, to, cap, flow, cost = (list(a) for a in (g.head, g.adj, g.to, g.cap, g.flow, g.cost))
+        prev_edge = [-1] * N
         INF = float('inf')
         res = 0  # total cost
-        flow = 0
+        total = 0
+
+        heappush, heappop = heapq.heappush, heapq.heappop
 
-        h = [0] * N #potential
+        h = self._initial_potentials(source) #potential
 
-        while flow < max_flow:
+        while total < max_flow:
             dist = [INF] * N
             dist[source] = 0
-            pq = [(0, source)]
+            done = [False] * N
+            if radix:
+                pq = RadixHeap()
+                pq.push(0, source)
+            else:
+                pq = [(0, source)]
+            # stop as soon as the sink is settled
             while pq:
-                currCost, u = heapq.heappop(pq)
-                if dist[u] < currCost:
+                currCost, u = pq.pop() if radix else heappop(pq)
+                if done[u]:
                     continue
-                for i, (v, cap, cost, rev) in enumerate(self.graph[u]):
-                    if cap > 0 and dist[v] > dist[u] + cost + h[u] - h[v]:
-                        dist[v] = dist[u] + cost + h[u] - h[v]
-                        prevv[v] = u
-                        preve[v] = i
-                        heapq.heappush(pq, (dist[v], v))
-            
-            if dist[sink] == INF:
+                done[u] = True
+                if u == sink:
+                    break
+                hu = h[u] + currCost
+                for i in range(head[u], head[u + 1]):
+                    e = adj[i]
+                    if cap[e] > flow[e]:
+                        v = to[e]
+                        nd = hu + cost[e] - h[v]
+                        if nd < dist[v]:
+                            dist[v] = nd
+                            prev_edge[v] = e
+                            if radix:
+                                pq.push(nd, v)
+                            else:
+                                heappush(pq, (nd, v))
+
+            if not done[sink]:
                 # no more augmenting path
                 break
 
+            # vertices not settled are at least as far as the sink, which keeps reduced costs >= 0
+            D = dist[sink]
             for i in range(N):
-                if dist[i] < INF:
-                    h[i] += dist[i]
-            
-            d = max_flow - flow
+                h[i] += dist[i] if done[i] else D
+
+            d = max_flow - total
             v = sink
             # find minimum residual capacity on the path
             while v != source:
-                u = prevv[v]
-                edge = self.graph[u][preve[v]]
-                d = min(d, edge[1])
-                v = u
-            
-            flow += d
-            res +=  d * h[sink]
+                e = prev_edge[v]
+                d = min(d, cap[e] - flow[e])
+                v = to[e ^ 1]
+
+            total += d
+            res +=  d * (h[sink] - h[source])
             v = sink
             #Update residuals
             while v != source:
-                u = prevv[v]
-                edge = self.graph[u][preve[v]]
-                edge[1] -= d
-                self.graph[v][edge[3]][1] += d
-                v = u
+                e = prev_edge[v]
+                flow[e] += d
+                flow[e ^ 1] -= d
+                v = to[e ^ 1]
+
+        g.set_flow(flow)
+        return total, res
+
+    # Goldberg-Tarjan cost scaling. The flow value F (max flow, capped at max_flow) comes from Dinic,
+    # then a min-cost flow of value F is found by eps-scaling push-relabel on prices p: edge e = (u, v)
+    # is admissible when it has residual capacity and cost[e] + p[u] - p[v] < 0. Costs are multiplied by
+    # N + 1 so that the final eps = 1 is below 1/N in original units, which is optimal for integer costs.
+    # Continues from the flow already on the graph (F is what can be added on top); running time does
+    # not depend on F.
+    def costScaling(self, source, sink, max_flow=float('inf'), alpha=8):
+        N = self.N
+        g = self.graph
+        if not g.integral_costs():
+            raise ValueError("cost scaling needs integer costs")
+        start = list(g.flow)
+        F = Dinic(g).max_flow(source, sink)
+        g.set_flow(start)
+        if max_flow < F:
+            F = max_flow
+        head, adj, to, cap, cost = (list(a) for a in (g.head, g.adj, g.to, g.cap, g.cost))
+        flow = list(start)
+        scale = N + 1
+        cost = [c * scale for c in cost]
+        excess = [0] * N
+        excess[source] += F
+        excess[sink] -= F
+        p = [0] * N
+        eps = max(max(map(abs, cost), default=0), 1)
+
+        while True:
+            eps = max(eps // alpha, 1)
+            # refine: saturate every residual edge with negative reduced cost, giving an eps-optimal pseudoflow
+            for e in range(len(to)):
+                r = cap[e] - flow[e]
+                if r > 0:
+                    u, v = to[e ^ 1], to[e]
+                    if cost[e] + p[u] - p[v] < 0:
+                        flow[e] += r
+                        flow[e ^ 1] -= r
+                        excess[u] -= r
+                        excess[v] += r
+            it = head[:-1]
+            active = deque(u for u in range(N) if excess[u] > 0)
+            while active:
+                u = active.popleft()
+                end = head[u + 1]
+                pu = p[u]
+                while excess[u] > 0:
+                    i = it[u]
+                    if i == end:
+                        # relabel: lower p[u] until some residual edge becomes admissible
+                        best = None
+                        for j in range(head[u], end):
+                            e = adj[j]
+                            if cap[e] > flow[e]:
+                                c = p[to[e]] - cost[e]
+                                if best is None or c > best:
+                                    best = c
+                        if best is None:
+                            raise ValueError("excess cannot reach a deficit")
+                        pu = p[u] = best - eps
+                        it[u] = head[u]
+                        continue
+                    e = adj[i]
+                    r = cap[e] - flow[e]
+                    v = to[e]
+                    if r > 0 and cost[e] + pu - p[v] < 0:
+                        d = excess[u] if excess[u] < r else r
+                        flow[e] += d
+                        flow[e ^ 1] -= d
+                        excess[u] -= d
+                        if excess[v] <= 0 < excess[v] + d:
+                            active.append(v)
+                        excess[v] += d
+                    else:
+                        it[u] = i + 1
+            if eps == 1:
+                break
+
+        g.set_flow(flow)
+        return F, sum(g.cost[e] * (flow[e] - start[e]) for e in range(0, len(to), 2))
+
+    METHODS = {"ssp": "successiveShortestPaths", "cost_scaling": "costScaling"}
+
+    # min-cost flow of value min(max flow, max_flow) from source to sink: (flow, cost). Both methods
+    # continue from the flow already on the graph, so a second call returns only the flow and cost it
+    # adds; call self.graph.reset() first to solve from scratch.
+    def solve(self, source, sink, max_flow=float('inf'), method="ssp", **options):
+        if method not in self.METHODS:
+            raise ValueError(f"method must be one of {sorted(self.METHODS)}")
+        return getattr(self, self.METHODS[method])(source, sink, max_flow, **options)
+
+# n x n assignment as a transport network: source -> workers -> jobs -> sink
+def assignment_network(n, max_cost=100, seed=0):
+    rng = random.Random(seed)
+    mcmf = MCMF(2 * n + 2)
+    s, t = 2 * n, 2 * n + 1
+    for i in range(n):
+        mcmf.add_edge(s, i, 1, 0)
+        mcmf.add_edge(n + i, t, 1, 0)
+        for j in range(n):
+            mcmf.add_edge(i, n + j, 1, rng.randint(1, max_cost))
+    return mcmf, s, t
+
+# L layers of W vertices, complete between consecutive layers, capacities up to max_cap.
+# The max flow grows with max_cap and SSP needs one Dijkstra per augmenting path.
+def layered_network(W, L, max_cap, max_cost=100, seed=0):
+    rng = random.Random(seed)
+    N = W * L + 2
+    mcmf = MCMF(N)
+    s, t = N - 2, N - 1
+    for i in range(W):
+        mcmf.add_edge(s, i, W * max_cap, 0)
+        mcmf.add_edge((L - 1) * W + i, t, W * max_cap, 0)
+    for l in range(L - 1):
+        for i in range(W):
+            for j in range(W):
+                mcmf.add_edge(l * W + i, (l + 1) * W + j, rng.randint(1, max_cap), rng.randint(0, max_cost))
+    return mcmf, s, t
+
+def benchmark(sizes=(50, 100, 200), caps=(1, 10, 100, 1000), seed=0):
+    for n in sizes:
+        row = []
+        for queue in ("heapq", "radix"):
+            mcmf, s, t = assignment_network(n, seed=seed)
+            start = time.perf_counter()
+            flow, cost = mcmf.successiveShortestPaths(s, t, queue=queue)
+            row.append(f"{queue} flow {flow} cost {cost} in {time.perf_counter() - start:.3f}s")
+        mcmf, s, t = assignment_network(n, seed=seed)
+        start = time.perf_counter()
+        flow, cost = mcmf.solve(s, t, method="cost_scaling")
+        row.append(f"cost_scaling flow {flow} cost {cost} in {time.perf_counter() - start:.3f}s")
+        print(f"assignment n={n}: " + ", ".join(row))
+    for max_cap in caps:
+        row = []
+        for method, options in (("ssp", {"queue": "radix"}), ("cost_scaling", {})):
+            mcmf, s, t = layered_network(25, 4, max_cap, seed=seed)
+            start = time.perf_counter()
+            flow, cost = mcmf.solve(s, t, method=method, **options)
+            row.append(f"{method} cost {cost} in {time.perf_counter() - start:.3f}s")
+        print(f"layered 25x4 max_cap={max_cap} flow {flow}: " + ", ".join(row))
 
-        return flow, res
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,94 @@
+#Pairing heap (Fredman, Sedgewick, Sleator, Tarjan) with two-pass pairing
+#Simpler than a Fibonacci heap with much smaller constants; decrease_key is o(log n) amortized
+class PairingNode:
+    def __init__(self, key, value=None):
+        self.key = key
+        self.value = value
+        self.child = None    # leftmost child
+        self.sibling = None  # next sibling to the right
+        self.prev = None     # left sibling, or parent if leftmost child
+
+class PairingHeap:
+    def __init__(self):
+        self.root = None
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def insert(self, key, value=None):
+        node = PairingNode(key, value)
+        self.root = self._meld(self.root, node)
+        self.n += 1
+        return node
+
+    def find_min(self):
+        return self.root.key if self.root else None
+
+    def extract_min(self):
+        z = self.extract_min_node()
+        return z.key if z else None
+
+    def extract_min_node(self):
+        z = self.root
+        if z is None:
+            return None
+        self.root = self._merge_pairs(z.child)
+        if self.root:
+            self.root.prev = None
+        z.child = None
+        self.n -= 1
+        return z
+
+    def decrease_key(self, node, k):
+        if k > node.key:
+            raise ValueError("new key is greater than current key")
+        node.key = k
+        if node is self.root:
+            return
+        self._detach(node)
+        self.root = self._meld(self.root, node)
+
+    # link two roots, the larger key becomes the leftmost child of the smaller
+    def _meld(self, a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child:
+            a.child.prev = b
+        a.child = b
+        a.sibling = None
+        return a
+
+    # cut node (and its subtree) out of its parent's child list
+    def _detach(self, node):
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.prev = None
+        node.sibling = None
+
+    # two-pass pairing, iterative so long child lists cannot hit the recursion limit
+    def _merge_pairs(self, first):
+        pairs = []
+        x = first
+        while x:
+            a = x
+            b = x.sibling
+            x = b.sibling if b else None
+            a.sibling = a.prev = None
+            if b:
+                b.sibling = b.prev = None
+            pairs.append(self._meld(a, b))
+        root = None
+        for tree in reversed(pairs):
+            root = self._meld(tree, root)
+        return root
@@ -1,4 +1,10 @@
 #https://www.geeksforgeeks.org/dsa/introduction-to-push-relabel-algorithm/
+import random
+import time
+from collections import deque
+
+from flowgraph import FlowGraph
+
 class Edge:
     def __init__(self, flow, capacity, u, v):
         self.f = flow
@@ -24,6 +30,7 @@ class FlowNetwork:
     
     def preflow(self, s):
         self.ver[s].h = len(self.ver)
+        self.original = self.L  # edges appended from here on are residual bookkeeping
 
         for i in range(len(self.edge)):
             e = self.edge[i]
@@ -94,4 +101,141 @@ class FlowNetwork:
             if not self.push(u):
                 self.relabel(u)
             
-        return self.ver[t].ef
\ No newline at end of file
+        self.s = s
+        return self.ver[t].ef
+
+    # (source side, cut edges as (u, v, capacity)) of the last getMaxFlow
+    def min_cut(self):
+        side = {self.s}
+        q = deque([self.s])
+        while q:
+            u = q.popleft()
+            for e in self.edge:
+                if e.u == u and e.c > e.f and e.v not in side:
+                    side.add(e.v)
+                    q.append(e.v)
+        cut = [(e.u, e.v, e.c) for e in self.edge[:self.original] if e.u in side and e.v not in side]
+        return sorted(side), cut
+
+#Indexed push-relabel on a FlowGraph (flowgraph.py): CSR adjacency of edge ids, reverse of
+#e is e ^ 1 (no scan to find it), a current-arc pointer per vertex, and active vertices kept
+#in a FIFO queue or in height buckets (highest-label first).
+#selection="fifo" is O(V^3), selection="highest" is O(V^2 sqrt(E)).
+class IndexedFlowNetwork:
+    # N: vertex count, or an existing FlowGraph to run on (its flow is updated in place)
+    def __init__(self, N, selection="fifo"):
+        if selection not in ("fifo", "highest"):
+            raise ValueError("selection must be 'fifo' or 'highest'")
+        self.graph = N if isinstance(N, FlowGraph) else FlowGraph(N)
+        self.N = self.graph.n
+        self.selection = selection
+
+    def addEdge(self, u, v, cap):
+        return self.graph.add_edge(u, v, cap)
+
+    def getMaxFlow(self, s, t):
+        self.s = s
+        N = self.N
+        g = self.graph
+        head, adj, to, cap, flow = g.head, g.adj, g.to, g.cap, g.flow
+        h = [0] * N
+        excess = [0] * N
+        it = list(head[:-1])
+        h[s] = N
+        fifo = self.selection == "fifo"
+        queue = deque()
+        buckets = [[] for _ in range(2 * N)]
+        top = 0
+
+        def activate(v):
+            nonlocal top
+            if fifo:
+                queue.append(v)
+            else:
+                buckets[h[v]].append(v)
+                if h[v] > top:
+                    top = h[v]
+
+        for i in range(head[s], head[s + 1]):
+            e = adj[i]
+            c = cap[e] - flow[e]
+            if c > 0:
+                v = to[e]
+                flow[e] += c
+                flow[e ^ 1] -= c
+                if excess[v] == 0 and v != t and v != s:
+                    excess[v] = c
+                    activate(v)
+                else:
+                    excess[v] += c
+
+        def discharge(u):
+            end = head[u + 1]
+            while excess[u] > 0:
+                i = it[u]
+                if i == end:
+                    # relabel: one above the lowest residual neighbour
+                    h[u] = 1 + min(h[to[adj[j]]] for j in range(head[u], end) if cap[adj[j]] > flow[adj[j]])
+                    it[u] = head[u]
+                    continue
+                e = adj[i]
+                v = to[e]
+                r = cap[e] - flow[e]
+                if r > 0 and h[u] == h[v] + 1:
+                    d = excess[u] if excess[u] < r else r
+                    flow[e] += d
+                    flow[e ^ 1] -= d
+                    excess[u] -= d
+                    if excess[v] == 0 and v != s and v != t:
+                        excess[v] = d
+                        activate(v)
+                    else:
+                        excess[v] += d
+                else:
+                    it[u] = i + 1
+
+        if fifo:
+            while queue:
+                discharge(queue.popleft())
+        else:
+            while top >= 0:
+                bucket = buckets[top]
+                if not bucket:
+                    top -= 1
+                    continue
+                discharge(bucket.pop())
+        return excess[t]
+
+    # (source side, cut edges as (u, v, capacity)) of the last getMaxFlow
+    def min_cut(self):
+        return self.graph.min_cut(self.s)
+
+def random_network(N, M, max_cap=100, seed=0):
+    rng = random.Random(seed)
+    edges = []
+    while len(edges) < M:
+        u, v = rng.randrange(N), rng.randrange(N)
+        if u != v:
+            edges.append((u, v, rng.randint(1, max_cap)))
+    return edges
+
+#FlowNetwork's overflow() only looks at vertices 1..N-2, so s = 0 and t = N - 1 throughout
+def benchmark(sizes=((50, 300), (200, 1500), (1000, 8000)), seed=0):
+    for N, M in sizes:
+        edges = random_network(N, M, seed=seed)
+        row = []
+        for name, make in (("FlowNetwork", lambda: FlowNetwork(N)),
+                           ("fifo", lambda: IndexedFlowNetwork(N, "fifo")),
+                           ("highest", lambda: IndexedFlowNetwork(N, "highest"))):
+            if name == "FlowNetwork" and N > 200:
+                continue  # O(V E^2) in practice, too slow to wait for
+            net = make()
+            for u, v, c in edges:
+                net.addEdge(u, v, c)
+            start = time.perf_counter()
+            flow = net.getMaxFlow(0, N - 1)
+            row.append(f"{name} {flow} in {time.perf_counter() - start:.3f}s")
+        print(f"V={N} E={M}: " + ", ".join(row))
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,39 @@
+#Radix heap (Ahuja, Mehlhorn, Orlin, Tarjan) for monotone integer keys
+#Every popped key is >= the previous one, which holds for Dijkstra with non-negative integer weights.
+#Bucket i holds keys whose highest differing bit from the last popped key is bit i-1,
+#so each key moves down at most log(C) buckets over its lifetime.
+class RadixHeap:
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.last = 0
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def push(self, key, value=None):
+        if key < self.last:
+            raise ValueError("key is smaller than the last extracted key")
+        i = (key ^ self.last).bit_length()
+        while i >= len(self.buckets):
+            self.buckets.append([])
+        self.buckets[i].append((key, value))
+        self.n += 1
+
+    def pop(self):
+        if self.n == 0:
+            raise IndexError("pop from empty radix heap")
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            items = buckets[i]
+            buckets[i] = []
+            last = min(item[0] for item in items)
+            self.last = last
+            # redistribute into strictly lower buckets
+            for item in items:
+                buckets[(item[0] ^ last).bit_length()].append(item)
+        self.n -= 1
+        return buckets[0].pop()
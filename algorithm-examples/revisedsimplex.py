@@ -0,0 +1,376 @@
+#REVISED SIMPLEX with a sparse LU-factored basis
+#Same problem and result as simplex.two_phase_simplex: maximize c^T x s.t. A x (signs[i]) b[i], x >= 0.
+#A is stored by columns and by rows (indices + values) and the tableau is never formed. Each iteration
+#solves B alpha = a_q (FTRAN) for the entering column and B^T rho = e_r (BTRAN) for the leaving row,
+#and updates the reduced costs from the pivot row rho^T A.
+#The basis is factorised as B = L U by sparse Gaussian elimination with Markowitz-style pivoting
+#(shortest column, then shortest row within a threshold of the largest entry). Later basis changes
+#are kept as product-form eta vectors, B_k^-1 = E_k ... E_1 B_0^-1, and the basis is refactorised
+#every `refactor` updates.
+import heapq
+import random
+import time
+
+from simplex import EPS, SimplexResult, two_phase_simplex
+
+PIVOT_TOL = 1e-9
+DROP_TOL = 1e-14
+
+class SingularBasis(ValueError):
+    pass
+
+class BasisFactor:
+    """LU factors of the basis matrix plus an eta file of later column replacements."""
+
+    def __init__(self, m, col_rows, col_vals, basis):
+        self.m = m
+        self.col_rows = col_rows
+        self.col_vals = col_vals
+        self.factor(basis)
+
+    def factor(self, basis):
+        m = self.m
+        rows = [{} for _ in range(m)]  # active submatrix by rows: rows[i][pos] = value
+        cols = [set() for _ in range(m)]  # active rows of each basis position
+        for pos, j in enumerate(basis):
+            for i, v in zip(self.col_rows[j], self.col_vals[j]):
+                rows[i][pos] = v
+                cols[pos].add(i)
+        heap = [(len(cols[q]), q) for q in range(m)]
+        heapq.heapify(heap)
+        done = [False] * m
+        self.L = []  # L[k]: multipliers (row, l) of step k
+        self.Udiag = []
+        self.Uoff = []  # Uoff[k]: off-diagonal (pos, value) of the pivot row of step k
+        self.prow = []
+        self.pcol = []
+        self.Ucol = [[] for _ in range(m)]  # Ucol[pos]: (k, value) entries of U above the diagonal in column pos
+        for _ in range(m):
+            # column with fewest active entries (lazy heap: skip stale counts)
+            while True:
+                count, q = heapq.heappop(heap)
+                if not done[q] and count == len(cols[q]):
+                    break
+            if count == 0:
+                raise SingularBasis("basis is singular")
+            big = max(abs(rows[i][q]) for i in cols[q])
+            if big < PIVOT_TOL:
+                raise SingularBasis("basis is singular")
+            p = min((i for i in cols[q] if abs(rows[i][q]) >= 0.1 * big), key=lambda i: len(rows[i]))
+            pivot_row = rows[p]
+            piv = pivot_row[q]
+            for c in pivot_row:
+                cols[c].discard(p)
+            mult = []
+            for i in cols[q]:
+                ri = rows[i]
+                l = ri.pop(q) / piv
+                mult.append((i, l))
+                for c, v in pivot_row.items():
+                    if c == q:
+                        continue
+                    nv = ri.get(c, 0.0) - l * v
+                    if abs(nv) > DROP_TOL:
+                        if c not in ri:
+                            cols[c].add(i)
+                        ri[c] = nv
+                    elif c in ri:
+                        del ri[c]
+                        cols[c].discard(i)
+            cols[q] = set()
+            done[q] = True
+            for c in pivot_row:
+                if c != q:
+                    heapq.heappush(heap, (len(cols[c]), c))
+            self.L.append(mult)
+            self.Udiag.append(piv)
+            self.Uoff.append([(c, v) for c, v in pivot_row.items() if c != q])
+            k = len(self.prow)
+            for c, v in self.Uoff[-1]:
+                self.Ucol[c].append((k, v))
+            self.prow.append(p)
+            self.pcol.append(q)
+            rows[p] = None
+        self.etas = []
+
+    def ftran(self, idx, vals):
+        """Solve B x = a for a sparse a; returns x as a dense list indexed by basis position."""
+        y = [0.0] * self.m
+        for i, v in zip(idx, vals):
+            y[i] = v
+        prow = self.prow
+        for k, mult in enumerate(self.L):
+            yp = y[prow[k]]
+            if yp:
+                for i, l in mult:
+                    y[i] -= l * yp
+        x = [0.0] * self.m
+        pcol, Udiag, Ucol = self.pcol, self.Udiag, self.Ucol
+        for k in range(self.m - 1, -1, -1):
+            xk = y[prow[k]]
+            if xk:
+                q = pcol[k]
+                xk /= Udiag[k]
+                x[q] = xk
+                for k2, v in Ucol[q]:
+                    y[prow[k2]] -= v * xk
+        for r, piv, entries in self.etas:
+            xr = x[r] / piv
+            x[r] = xr
+            if xr:
+                for i, a in entries:
+                    x[i] -= a * xr
+        return x
+
+    def btran(self, d):
+        """Solve B^T y = d for d indexed by basis position; returns y indexed by row."""
+        d = list(d)
+        for r, piv, entries in reversed(self.etas):
+            s = d[r]
+            for i, a in entries:
+                s -= d[i] * a
+            d[r] = s / piv
+        y = [0.0] * self.m
+        prow, pcol, Udiag, Uoff = self.prow, self.pcol, self.Udiag, self.Uoff
+        for k in range(self.m):
+            z = d[pcol[k]] / Udiag[k]
+            if z:
+                for c, u in Uoff[k]:
+                    d[c] -= u * z
+            y[prow[k]] = z
+        for k in range(self.m - 1, -1, -1):
+            mult = self.L[k]
+            if mult:
+                s = 0.0
+                for i, l in mult:
+                    s += l * y[i]
+                y[prow[k]] -= s
+        return y
+
+    # basis position r now holds the column whose FTRAN is alpha
+    def update(self, r, alpha):
+        self.etas.append((r, alpha[r], [(i, a) for i, a in enumerate(alpha) if a and i != r]))
+
+def _sparse_rows(A):
+    """rows of A as (col, value) pairs; rows may be dense lists or {col: value} dicts"""
+    for row in A:
+        if isinstance(row, dict):
+            yield [(j, v) for j, v in row.items() if v]
+        else:
+            yield [(j, v) for j, v in enumerate(row) if v]
+
+def revised_simplex(c, A, b, signs, refactor=100):
+    """
+    Solve: maximize c^T x subject to A x (signs[i]) b[i], x >= 0
+    - c: objective coefficients (length n)
+    - A: m rows, each a dense list or a sparse {column: value} dict
+    - b, signs: as in simplex.two_phase_simplex
+    - refactor: eta updates between LU refactorisations
+    Returns SimplexResult.
+    """
+    m = len(A)
+    n = len(c)
+    assert len(b) == m and len(signs) == m
+
+    # columns: structural, then one slack/excess per inequality, then artificials
+    col_rows = [[] for _ in range(n)]
+    col_vals = [[] for _ in range(n)]
+    b2 = list(b)
+    s2 = list(signs)
+    for i, row in enumerate(_sparse_rows(A)):
+        flip = b2[i] < -EPS
+        if flip:
+            b2[i] = -b2[i]
+            s2[i] = {'<=': '>=', '>=': '<=', '=': '='}[s2[i]]
+        for j, v in row:
+            col_rows[j].append(i)
+            col_vals[j].append(-v if flip else v)
+    basis = [0] * m
+    artificial = []
+    for i in range(m):
+        if s2[i] in ('<=', '>='):
+            col_rows.append([i])
+            col_vals.append([1.0 if s2[i] == '<=' else -1.0])
+            if s2[i] == '<=':
+                basis[i] = len(col_rows) - 1
+    for i in range(m):
+        if s2[i] in ('>=', '='):
+            col_rows.append([i])
+            col_vals.append([1.0])
+            basis[i] = len(col_rows) - 1
+            artificial.append(basis[i])
+    total = len(col_rows)
+    first_art = total - len(artificial)
+    row_cols = [[] for _ in range(m)]  # A by rows as well, for the pivot row
+    row_vals = [[] for _ in range(m)]
+    for j in range(total):
+        for i, v in zip(col_rows[j], col_vals[j]):
+            row_cols[i].append(j)
+            row_vals[i].append(v)
+
+    lu = BasisFactor(m, col_rows, col_vals, basis)
+    is_basic = [False] * total
+    for j in basis:
+        is_basic[j] = True
+    rows_b = [i for i in range(m) if b2[i]]
+    xB = lu.ftran(rows_b, [b2[i] for i in rows_b])
+
+    # returns True when the basis was refactorised
+    def pivot(q, r, alpha):
+        nonlocal xB
+        is_basic[basis[r]] = False
+        basis[r] = q
+        is_basic[q] = True
+        lu.update(r, alpha)
+        if len(lu.etas) >= refactor:
+            lu.factor(basis)
+            xB = lu.ftran(rows_b, [b2[i] for i in rows_b])
+            return True
+        return False
+
+    # minimise cost^T x over columns [0, limit) entering; returns "optimal" or "unbounded"
+    # Reduced costs d are computed once from the prices y = B^-T c_B and then kept up to date with the
+    # pivot row rho^T A (rho = B^-T e_r), which only touches rows where rho is non-zero.
+    def run(cost, limit):
+        def price():
+            y = lu.btran([cost[j] for j in basis])
+            d = [0.0] * total
+            for j in range(total):
+                if not is_basic[j]:
+                    s = cost[j]
+                    for i, v in zip(col_rows[j], col_vals[j]):
+                        s -= y[i] * v
+                    d[j] = s
+            return d
+
+        d = price()
+        degenerate = 0
+        while True:
+            # Dantzig pricing; Bland's rule after a long run of degenerate pivots to break cycling
+            bland = degenerate > 50
+            q = -1
+            best = -EPS
+            for j in range(limit):
+                if d[j] < best and not is_basic[j]:
+                    q, best = j, d[j]
+                    if bland:
+                        break
+            if q < 0:
+                return "optimal"
+            alpha = lu.ftran(col_rows[q], col_vals[q])
+            r = -1
+            theta = 0.0
+            for i in range(m):
+                a = alpha[i]
+                if a > PIVOT_TOL:
+                    ratio = max(xB[i], 0.0) / a
+                    if r < 0 or ratio < theta - EPS or (ratio <= theta + EPS and basis[i] < basis[r]):
+                        r, theta = i, ratio
+            if r < 0:
+                return "unbounded"
+            degenerate = degenerate + 1 if theta <= EPS else 0
+            e = [0.0] * m
+            e[r] = 1.0
+            rho = lu.btran(e)
+            step = d[q] / alpha[r]
+            for i in range(m):
+                ri = rho[i]
+                if abs(ri) > DROP_TOL:
+                    ri *= step
+                    for j, v in zip(row_cols[i], row_vals[i]):
+                        d[j] -= ri * v
+            leaving = basis[r]
+            for i in range(m):
+                if alpha[i]:
+                    xB[i] -= theta * alpha[i]
+            xB[r] = theta
+            if pivot(q, r, alpha):
+                d = price()
+            else:
+                d[q] = 0.0
+                d[leaving] = -step
+
+    if artificial:
+        cost = [0.0] * first_art + [1.0] * len(artificial)
+        run(cost, total)
+        if sum(xB[r] for r in range(m) if basis[r] >= first_art) > 1e-7:
+            return SimplexResult("infeasible")
+        # pivot basic artificials (all at zero) out where some real column can replace them
+        for r in range(m):
+            if basis[r] < first_art:
+                continue
+            e = [0.0] * m
+            e[r] = 1.0
+            rho = lu.btran(e)
+            for j in range(first_art):
+                if not is_basic[j]:
+                    a = sum(rho[i] * v for i, v in zip(col_rows[j], col_vals[j]))
+                    if abs(a) > 1e-7:
+                        alpha = lu.ftran(col_rows[j], col_vals[j])
+                        theta = xB[r] / alpha[r]
+                        for i in range(m):
+                            if alpha[i]:
+                                xB[i] -= theta * alpha[i]
+                        xB[r] = theta
+                        pivot(j, r, alpha)
+                        break
+            # otherwise row r is redundant: its artificial stays basic at zero and never moves
+
+    cost = [-float(v) for v in c] + [0.0] * (total - n)
+    status = run(cost, first_art)
+    if status != "optimal":
+        return SimplexResult(status)
+    x = [0.0] * n
+    for r, j in enumerate(basis):
+        if j < n:
+            x[j] = xB[r]
+    return SimplexResult("optimal", objective=sum(cj * xj for cj, xj in zip(c, x)), x=x)
+
+# maximize c^T x s.t. A x <= b with sparse non-negative A; every column has an entry, so it is bounded
+def random_sparse_lp(m, n, per_row=5, seed=0):
+    rng = random.Random(seed)
+    A = [{} for _ in range(m)]
+    for i in range(m):
+        for j in rng.sample(range(n), per_row):
+            A[i][j] = float(rng.randint(1, 9))
+    for j in range(n):
+        A[rng.randrange(m)][j] = float(rng.randint(1, 9))
+    b = [float(rng.randint(10, 100)) for _ in range(m)]
+    c = [float(rng.randint(1, 20)) for _ in range(n)]
+    return c, A, b, ['<='] * m
+
+# banded sparse A <= b: row i touches a few columns around i * n / m, like a staircase/multi-period model
+def banded_lp(m, n, width=4, seed=0):
+    rng = random.Random(seed)
+    A = [{} for _ in range(m)]
+    for i in range(m):
+        centre = i * n // m
+        for j in range(max(0, centre - width), min(n, centre + width + 1)):
+            if rng.random() < 0.6:
+                A[i][j] = float(rng.randint(1, 9))
+    for j in range(n):
+        A[min(m - 1, j * m // n)][j] = float(rng.randint(1, 9))
+    b = [float(rng.randint(10, 100)) for _ in range(m)]
+    c = [float(rng.randint(1, 20)) for _ in range(n)]
+    return c, A, b, ['<='] * m
+
+def benchmark(sizes=((100, 150), (300, 450)), banded=(1000, 5000), seed=0):
+    for m, n in sizes:
+        c, A, b, signs = random_sparse_lp(m, n, seed=seed)
+        dense = [[row.get(j, 0.0) for j in range(n)] for row in A]
+        start = time.perf_counter()
+        res = two_phase_simplex(c, dense, b, signs)
+        row = [f"tableau {res.objective:.4f} in {time.perf_counter() - start:.3f}s"]
+        start = time.perf_counter()
+        res = revised_simplex(c, A, b, signs)
+        row.append(f"revised {res.objective:.4f} in {time.perf_counter() - start:.3f}s")
+        print(f"random m={m} n={n}: " + ", ".join(row))
+    # a dense tableau for these would hold m * (n + m) floats
+    for m in banded:
+        c, A, b, signs = banded_lp(m, 3 * m // 2, seed=seed)
+        start = time.perf_counter()
+        res = revised_simplex(c, A, b, signs)
+        print(f"banded m={m} n={3 * m // 2}: revised {res.objective:.4f} in {time.perf_counter() - start:.3f}s")
+
+if __name__ == "__main__":
+    benchmark()
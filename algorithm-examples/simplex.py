@@ -1,17 +1,40 @@
-from math import isclose
+import random
+import time
+from math import isclose, sqrt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 EPS = 1e-9
+INF = float('inf')
 
 class SimplexResult:
-    def __init__(self, status, objective=None, x=None):
-        # status: "optimal", "infeasible", "unbounded"
+    def __init__(self, status, objective=None, x=None, iterations=0, stats=None, basis=None, problem=None,
+                 final=None):
+        # status: "optimal", "infeasible", "unbounded", "iteration_limit"
         self.status = status
         self.objective = objective
         self.x = x or []
+        self.iterations = iterations
+        # pricing rule, pivots and seconds per phase, degenerate pivots, total time
+        self.stats = stats or {}
+        # final basic columns (original variables 0..n-1, then one slack/excess per inequality row)
+        # and a copy of the (c, A, b, signs) solved, for resolve()
+        self.basis = basis
+        self.problem = problem
+        # optimal tableau kept for resolve() (_FinalTableau), None otherwise
+        self.final = final
 
     def __repr__(self):
         return f"SimplexResult(status={self.status!r}, objective={self.objective}, x={self.x})"
 
+def _new_stats(pricing_name):
+    return {"pricing": pricing_name, "phase1_iterations": 0, "phase2_iterations": 0, "dual_iterations": 0,
+            "degenerate_pivots": 0, "phase1_time": 0.0, "phase2_time": 0.0, "dual_time": 0.0,
+            "warm_start": None}
+
 def _pivot(tableau, row, col):
     """Perform pivot on tableau at (row, col). Modifies tableau in-place."""
     pivot_val = tableau[row][col]
@@ -28,7 +51,7 @@ def _pivot(tableau, row, col):
                 tableau[r] = [tableau[r][c] - factor * tableau[row][c] for c in range(n)]
 
 def _find_pivot_column(objective_row, basic_vars_idx):
-    """Bland's rule isn't strictly required; choose most negative coefficient (max improvement)."""
+    """Dantzig's rule: choose most negative coefficient (max improvement)."""
     # objective_row is the last row (for max problems we use neg coeffs)
     # return index (col) of entering variable or None if optimal
     best = None
@@ -39,8 +62,9 @@ def _find_pivot_column(objective_row, basic_vars_idx):
             best_val = val
     return best
 
-def _find_pivot_row(tableau, col):
-    """Find leaving variable row using minimum ratio test. Return None if unbounded."""
+def _find_pivot_row(tableau, col, row_vars=None):
+    """Find leaving variable row using minimum ratio test. Return None if unbounded.
+    With row_vars (basic variable of each row), ties go to the smallest variable index (Bland)."""
     m = len(tableau)
     n = len(tableau[0])
     min_ratio = None
@@ -51,42 +75,827 @@ def _find_pivot_row(tableau, col):
             rhs = tableau[i][-1]
             ratio = rhs / a_ij
             if ratio >= -EPS:
-                if min_ratio is None or ratio < min_ratio - EPS or (isclose(ratio, min_ratio) and i < min_row):
+                if min_ratio is None or ratio < min_ratio - EPS:
                     min_ratio = ratio
                     min_row = i
+                elif isclose(ratio, min_ratio) and row_vars is not None and row_vars[i] < row_vars[min_row]:
+                    min_row = i
     return min_row
 
+# NumPy backend: the tableau is one preallocated float64 array and every step is vectorised
+
+def _pivot_np(tableau, row, col, scratch=None):
+    """Pivot as a rank-1 update in place; scratch (same shape) avoids allocating the outer product."""
+    pivot_val = tableau[row, col]
+    assert abs(pivot_val) > EPS, "Pivot is too small"
+    tableau[row] /= pivot_val
+    factors = tableau[:, col].copy()
+    factors[row] = 0.0
+    if scratch is None:
+        scratch = np.empty_like(tableau)
+    np.multiply(factors[:, None], tableau[row], out=scratch)
+    tableau -= scratch
+
+def _find_pivot_column_np(objective_row, basic_vars):
+    j = int(np.argmin(objective_row[:-1]))
+    return j if objective_row[j] < -EPS else None
+
+def _find_pivot_row_np(tableau, col, row_vars=None):
+    column = tableau[:-1, col]
+    rhs = tableau[:-1, -1]
+    ratios = np.full(column.shape, np.inf)
+    positive = column > EPS
+    ratios[positive] = rhs[positive] / column[positive]
+    ratios[ratios < -EPS] = np.inf
+    best = ratios.min(initial=np.inf)  # no constraint rows: unbounded, as in _find_pivot_row
+    if best == np.inf:
+        return None
+    ties = np.flatnonzero(ratios <= best + EPS)
+    if row_vars is not None:
+        return int(min(ties, key=lambda i: row_vars[i]))
+    # lowest row among the (near-)ties, as in _find_pivot_row
+    return int(ties[0])
+
+# Pricing rules: select() returns the entering column (None when optimal) from the objective row,
+# where a negative entry means the variable improves the objective. update() sees the tableau just
+# before each pivot, for rules that keep weights. Each works on list and NumPy tableaus.
+
+class DantzigPricing:
+    """Most negative reduced cost."""
+    name = "dantzig"
+
+    def reset(self, tableau):
+        pass
+
+    def select(self, tableau, basic_vars):
+        if isinstance(tableau, list):
+            return _find_pivot_column(tableau[-1], basic_vars)
+        return _find_pivot_column_np(tableau[-1], basic_vars)
+
+    def update(self, tableau, row, col, leaving):
+        pass
+
+class BlandPricing(DantzigPricing):
+    """Smallest improving index; with the matching ratio-test tie rule it cannot cycle."""
+    name = "bland"
+
+    def select(self, tableau, basic_vars):
+        obj = tableau[-1]
+        if isinstance(tableau, list):
+            for j, val in enumerate(obj[:-1]):
+                if val < -EPS:
+                    return j
+            return None
+        improving = np.flatnonzero(obj[:-1] < -EPS)
+        return int(improving[0]) if len(improving) else None
+
+class SteepestEdgePricing(DantzigPricing):
+    """Most negative reduced cost per unit length of the edge, r_j / sqrt(1 + ||B^-1 a_j||^2).
+    The tableau already holds every B^-1 a_j, so the norms are exact."""
+    name = "steepest-edge"
+
+    def select(self, tableau, basic_vars):
+        if isinstance(tableau, list):
+            best, best_val = None, 0.0
+            for j, val in enumerate(tableau[-1][:-1]):
+                if val < -EPS:
+                    norm = sqrt(1.0 + sum(row[j] * row[j] for row in tableau[:-1]))
+                    if val / norm < best_val:
+                        best, best_val = j, val / norm
+            return best
+        obj = tableau[-1, :-1]
+        score = obj / np.sqrt(1.0 + np.einsum('ij,ij->j', tableau[:-1, :-1], tableau[:-1, :-1]))
+        score[obj >= -EPS] = 0.0
+        j = int(np.argmin(score))
+        return j if score[j] < 0 else None
+
+class DevexPricing(DantzigPricing):
+    """Forrest-Goldfarb devex: approximate steepest-edge weights w_j, maximise r_j^2 / w_j.
+    Weights start at 1 for the reference framework and are updated from the pivot row."""
+    name = "devex"
+
+    def reset(self, tableau):
+        self.w = [1.0] * (len(tableau[0]) - 1)
+
+    def select(self, tableau, basic_vars):
+        w = self.w
+        best, best_val = None, 0.0
+        for j, val in enumerate(tableau[-1][:-1]):
+            if val < -EPS and val * val / w[j] > best_val:
+                best, best_val = j, val * val / w[j]
+        return best
+
+    def update(self, tableau, row, col, leaving):
+        w = self.w
+        prow = tableau[row]
+        a_q = prow[col]
+        wq = w[col]
+        for j in range(len(w)):
+            a = prow[j]
+            if a and j != col:
+                ratio = a / a_q
+                if ratio * ratio * wq > w[j]:
+                    w[j] = ratio * ratio * wq
+        if leaving is not None:
+            w[leaving] = max(wq / (a_q * a_q), 1.0)
+
+class PartialPricing(DantzigPricing):
+    """Dantzig within one block of columns at a time, starting where the last search stopped;
+    later blocks are only scanned when the current one has no improving column."""
+    name = "partial"
+
+    def __init__(self, block=None):
+        self.block = block
+
+    def reset(self, tableau):
+        n = len(tableau[0]) - 1
+        self.size = self.block or max(n // 8, 16)
+        self.start = 0
+
+    def select(self, tableau, basic_vars):
+        obj = tableau[-1]
+        n = len(obj) - 1
+        for k in range(0, n, self.size):
+            lo = self.start + k
+            best, best_val = None, -EPS
+            for j in range(lo, lo + min(self.size, n - k)):
+                j %= n
+                if obj[j] < best_val:
+                    best, best_val = j, obj[j]
+            if best is not None:
+                self.start = lo % n
+                return best
+        return None
+
+PRICING = {rule.name: rule for rule in (DantzigPricing, BlandPricing, SteepestEdgePricing, DevexPricing, PartialPricing)}
+
+# Presolve: reductions on the LP before any tableau is built. Rows are kept sparse (dicts) while
+# reducing; every eliminated column leaves a postsolve step, replayed in reverse to recover x.
+class _Infeasible(Exception):
+    pass
+
+class Presolve:
+    """
+    Reduce max c^T x, A x (signs) b, x >= 0:
+    - rows: empty, singleton (turned into bounds), duplicate (parallel rows merged), redundant and
+      forcing (from activity bounds)
+    - columns: fixed, empty, dominated (every row pushes them to one bound), free singleton in an
+      equality row (substituted out)
+    - implied bounds tightened from the rows; they only fix variables and detect infeasibility
+    reduce() returns None, "infeasible", or "unbounded" (unbounded if the reduced LP is feasible).
+    reduced() gives the smaller (c, A, b, signs); postsolve(x) maps its solution back.
+    """
+    TOL = 1e-9
+
+    def __init__(self, c, A, b, signs):
+        self.n = len(c)
+        self.c = [float(v) for v in c]
+        self.rows = {i: {j: float(v) for j, v in enumerate(row) if v} for i, row in enumerate(A)}
+        self.b = {i: float(v) for i, v in enumerate(b)}
+        self.signs = dict(enumerate(signs))
+        self.cols = {j: set() for j in range(self.n)}  # column -> rows using it
+        for i, row in self.rows.items():
+            for j in row:
+                self.cols[j].add(i)
+        self.lo = [0.0] * self.n  # bounds enforced in the reduced problem
+        self.up = [INF] * self.n
+        self.ilo = [0.0] * self.n  # implied by the rows
+        self.iup = [INF] * self.n
+        self.steps = []  # postsolve steps
+        self.unbounded = False
+        self.report = dict.fromkeys(("empty_rows", "singleton_rows", "duplicate_rows", "redundant_rows",
+                                     "forcing_rows", "fixed_columns", "empty_columns", "dominated_columns",
+                                     "free_singleton_columns", "tightened_bounds"), 0)
+        self._order = None
+
+    def reduce(self):
+        try:
+            changed = True
+            while changed:
+                changed = False
+                for step in (self._row_pass, self._column_pass, self._duplicate_pass, self._activity_pass):
+                    changed |= step()
+        except _Infeasible:
+            return "infeasible"
+        return "unbounded" if self.unbounded else None
+
+    # row i as coefficients and rhs of a '<=' row; '=' rows come back as their '<=' half
+    def _leq(self, i):
+        if self.signs[i] == '>=':
+            return {j: -v for j, v in self.rows[i].items()}, -self.b[i]
+        return self.rows[i], self.b[i]
+
+    def _drop_row(self, i):
+        for j in self.rows.pop(i):
+            self.cols[j].discard(i)
+        del self.b[i], self.signs[i]
+
+    def _fix(self, j, value):
+        if value < self.lo[j] - 1e-7 or value > self.up[j] + 1e-7:
+            raise _Infeasible
+        for i in self.cols.pop(j):
+            self.b[i] -= self.rows[i].pop(j) * value
+        self.steps.append(("fix", j, value))
+
+    def _bound(self, j, lo=None, up=None):
+        if lo is not None and lo > self.lo[j]:
+            self.lo[j] = lo
+            self.ilo[j] = max(self.ilo[j], lo)
+        if up is not None and up < self.up[j]:
+            self.up[j] = up
+            self.iup[j] = min(self.iup[j], up)
+        if self.lo[j] > self.up[j] + self.TOL:
+            raise _Infeasible
+
+    def _row_pass(self):
+        changed = False
+        for i in list(self.rows):
+            row = self.rows[i]
+            if len(row) > 1:
+                continue
+            if not row:
+                rhs, sign = self.b[i], self.signs[i]
+                if (sign == '<=' and rhs < -1e-7) or (sign == '>=' and rhs > 1e-7) or (sign == '=' and abs(rhs) > 1e-7):
+                    raise _Infeasible
+                self.report["empty_rows"] += 1
+            else:
+                (j, a), = row.items()
+                value, sign = self.b[i] / a, self.signs[i]
+                if a < 0 and sign != '=':
+                    sign = '>=' if sign == '<=' else '<='
+                self._bound(j, lo=value if sign != '<=' else None, up=value if sign != '>=' else None)
+                self.report["singleton_rows"] += 1
+            self._drop_row(i)
+            changed = True
+        return changed
+
+    def _column_pass(self):
+        changed = False
+        for j in list(self.cols):
+            rows, cj, lo, up = self.cols[j], self.c[j], self.lo[j], self.up[j]
+            if up - lo <= self.TOL:
+                self._fix(j, lo)
+                self.report["fixed_columns"] += 1
+            elif self.iup[j] - self.ilo[j] <= self.TOL:
+                self._fix(j, min(max(self.ilo[j], lo), up))
+                self.report["fixed_columns"] += 1
+            elif not rows:
+                if cj > self.TOL and up == INF:
+                    self.unbounded = True
+                self._fix(j, up if cj > self.TOL and up < INF else lo)
+                self.report["empty_columns"] += 1
+            elif all(self.signs[i] != '=' for i in rows):
+                # direction of x_j in each row read as '<=': all > 0 means larger x_j only tightens rows
+                d = [self._leq(i)[0][j] for i in rows]
+                if cj <= self.TOL and all(v > 0 for v in d):
+                    self._fix(j, lo)
+                elif cj >= -self.TOL and all(v < 0 for v in d):
+                    if up < INF:
+                        self._fix(j, up)
+                    else:
+                        # x_j can satisfy all its rows on its own: drop them, pick x_j afterwards;
+                        # with c_j > 0 it can also grow without limit
+                        self.unbounded |= cj > self.TOL
+                        absorbed = []
+                        for i in list(rows):
+                            coefs, rhs = self._leq(i)
+                            absorbed.append(({k: v for k, v in coefs.items() if k != j}, rhs, coefs[j]))
+                            self._drop_row(i)
+                            self.report["redundant_rows"] += 1
+                        del self.cols[j]
+                        self.steps.append(("absorb", j, lo, absorbed))
+                else:
+                    continue
+                self.report["dominated_columns"] += 1
+            elif len(rows) == 1 and up == INF:
+                i = next(iter(rows))
+                if self.signs[i] != '=':
+                    continue
+                # x_j = (b_i - rest) / a: substitute into the objective, x_j >= lo becomes an inequality
+                row = self.rows[i]
+                a = row.pop(j)
+                del self.cols[j]
+                self.steps.append(("solve", j, dict(row), self.b[i], a))
+                for k, v in row.items():
+                    self.c[k] -= cj * v / a
+                self.b[i] -= a * lo
+                self.signs[i] = '<=' if a > 0 else '>='
+                self.report["free_singleton_columns"] += 1
+            else:
+                continue
+            changed = True
+        return changed
+
+    def _duplicate_pass(self):
+        groups = {}
+        for i, row in self.rows.items():
+            if not row:
+                continue
+            scale = row[min(row)]
+            key = tuple(sorted((j, round(v / scale, 9)) for j, v in row.items()))
+            groups.setdefault(key, []).append((i, scale))
+        changed = False
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            # each row as lo <= (row / scale) x <= up
+            low, high = -INF, INF
+            for i, scale in group:
+                value, sign = self.b[i] / scale, self.signs[i]
+                if scale < 0 and sign != '=':
+                    sign = '>=' if sign == '<=' else '<='
+                if sign != '<=':
+                    low = max(low, value)
+                if sign != '>=':
+                    high = min(high, value)
+            if low > high + 1e-7:
+                raise _Infeasible
+            keep = [(i, scale) for i, scale in group[:2]]
+            for i, scale in keep:
+                for j in self.rows[i]:
+                    self.rows[i][j] /= scale
+            if high - low <= self.TOL or low == -INF or high == INF:
+                keep = keep[:1]
+                i = keep[0][0]
+                self.b[i], self.signs[i] = (high, '<=') if low == -INF else (low, '>=') if high == INF else (low, '=')
+            else:
+                (i, _), (k, _) = keep
+                self.b[i], self.signs[i] = low, '>='
+                self.b[k], self.signs[k] = high, '<='
+            kept = {i for i, _ in keep}
+            for i, _ in group:
+                if i not in kept:
+                    self._drop_row(i)
+                    self.report["duplicate_rows"] += 1
+                    changed = True
+        return changed
+
+    # least and greatest value of sum(coefs[j] x_j) over the bounds
+    @staticmethod
+    def _activity(coefs, lo, up):
+        low = high = 0.0
+        for j, v in coefs.items():
+            if v > 0:
+                low += v * lo[j]
+                high += v * up[j]
+            else:
+                low += v * up[j]
+                high += v * lo[j]
+        return low, high
+
+    def _activity_pass(self):
+        changed = False
+        tol = 1e-7
+        for i in list(self.rows):
+            coefs, rhs = self._leq(i)
+            low, high = self._activity(coefs, self.lo, self.up)
+            if low > rhs + tol or (self.signs[i] == '=' and high < rhs - tol):
+                raise _Infeasible
+            if self.signs[i] != '=' and high <= rhs + tol:
+                self._drop_row(i)
+                self.report["redundant_rows"] += 1
+                changed = True
+                continue
+            if low >= rhs - tol or (self.signs[i] == '=' and high <= rhs + tol):
+                # forcing: the row only holds with every variable at the bound that gives `low` (or `high`)
+                at_low = low >= rhs - tol
+                fixes = [(j, self.lo[j] if (v > 0) == at_low else self.up[j]) for j, v in coefs.items()]
+                self._drop_row(i)
+                for j, value in fixes:
+                    self._fix(j, value)
+                self.report["forcing_rows"] += 1
+                self.report["fixed_columns"] += len(fixes)
+                changed = True
+                continue
+            # implied bounds from this row (both halves for '=')
+            halves = [(coefs, rhs)]
+            if self.signs[i] == '=':
+                halves.append(({j: -v for j, v in coefs.items()}, -rhs))
+            for half, r in halves:
+                low, _ = self._activity(half, self.ilo, self.iup)
+                if low == -INF:
+                    continue
+                for j, v in half.items():
+                    rest = low - v * (self.ilo[j] if v > 0 else self.iup[j])
+                    bound = (r - rest) / v
+                    if v > 0 and bound < self.iup[j] - self.TOL * (1 + abs(bound)):
+                        self.iup[j] = bound
+                        self.report["tightened_bounds"] += 1
+                    elif v < 0 and bound > self.ilo[j] + self.TOL * (1 + abs(bound)):
+                        self.ilo[j] = bound
+                        self.report["tightened_bounds"] += 1
+                    if self.ilo[j] > self.iup[j] + tol:
+                        raise _Infeasible
+                    if self.iup[j] - self.ilo[j] <= self.TOL:
+                        changed = True
+        return changed
+
+    def reduced(self):
+        """(c, A, b, signs) over the remaining columns, shifted to x_j - lo_j >= 0, with x_j <= up_j rows"""
+        order = self._order = sorted(self.cols)
+        rows = sorted(self.rows)
+        A = [[self.rows[i].get(j, 0.0) for j in order] for i in rows]
+        b = [self.b[i] - sum(v * self.lo[j] for j, v in self.rows[i].items()) for i in rows]
+        signs = [self.signs[i] for i in rows]
+        for k, j in enumerate(order):
+            if self.up[j] < INF:
+                A.append([1.0 if kk == k else 0.0 for kk in range(len(order))])
+                b.append(self.up[j] - self.lo[j])
+                signs.append('<=')
+        return [self.c[j] for j in order], A, b, signs
+
+    def postsolve(self, y):
+        x = [0.0] * self.n
+        for k, j in enumerate(self._order):
+            x[j] = y[k] + self.lo[j]
+        for step in reversed(self.steps):
+            if step[0] == "fix":
+                _, j, value = step
+                x[j] = value
+            elif step[0] == "solve":
+                _, j, row, rhs, a = step
+                x[j] = (rhs - sum(v * x[k] for k, v in row.items())) / a
+            else:
+                _, j, lo, absorbed = step
+                # each row: rest + d x_j <= rhs with d < 0
+                x[j] = max([lo] + [(rhs - sum(v * x[k] for k, v in row.items())) / d for row, rhs, d in absorbed])
+        return x
+
 def _extract_solution(tableau, basic_vars, num_original_vars):
     m = len(tableau)
     n = len(tableau[0])
     x = [0.0] * num_original_vars
     for var_idx, row in basic_vars.items():
         if var_idx < num_original_vars:
-            x[var_idx] = tableau[row][-1]
-    obj = tableau[-1][-1]
+            x[var_idx] = float(tableau[row][-1])
+    obj = float(tableau[-1][-1])
     return obj, x
 
-def two_phase_simplex(c, A, b, signs):
+def _objective_row(tableau, basic_vars, c, use_np):
+    """Phase II objective row for maximize c^T x: -c (the tableau convention: coefficients are subtracted),
+    minus each basic row times its coefficient so that basic variables have 0 in it."""
+    obj_row = [0.0] * len(tableau[0])
+    for j in range(len(c)):
+        obj_row[j] = -c[j]
+    if use_np:
+        obj_row = np.array(obj_row)
+    for var, row in basic_vars.items():
+        coef = obj_row[var]
+        if abs(coef) > EPS:
+            if use_np:
+                obj_row -= coef * tableau[row]
+            else:
+                obj_row = [o - coef * t for o, t in zip(obj_row, tableau[row])]
+    return obj_row
+
+# What resolve() needs from an optimal solve: the final Phase II tableau B^-1 [A | S | b] (columns as in
+# SimplexResult.basis, then the RHS), its basic variables {column: row}, and for each constraint row i
+# where B^-1 e_i lives: ("col", j, mult) for a slack/excess column j, or ("side", k, mult) for column k
+# of `side`, the B^-1 columns of '=' rows (they have no slack), kept pivoted alongside the tableau.
+class _FinalTableau:
+    def __init__(self, tableau, basic_vars, side, inverse):
+        self.tableau = tableau
+        self.basic_vars = basic_vars
+        self.side = side
+        self.inverse = inverse
+
+def _pivot_count(stats):
+    return stats["phase1_iterations"] + stats["phase2_iterations"] + stats["dual_iterations"]
+
+def _pivot_basis(tableau, basic_vars, entering, leaving, side=None, scratch=None):
+    """Pivot on (leaving, entering) and let entering replace the basic variable of the leaving row.
+    side, the B^-1 columns of the '=' rows (see _FinalTableau), gets the same row operations in place."""
+    for var, r in basic_vars.items():
+        if r == leaving:
+            del basic_vars[var]
+            break
+    basic_vars[entering] = leaving
+    if isinstance(tableau, list):
+        if side is not None:
+            pivot_row = [v / tableau[leaving][entering] for v in side[leaving]]
+            side[leaving] = pivot_row
+            for r in range(len(side)):
+                factor = tableau[r][entering]
+                if r != leaving and abs(factor) > EPS:
+                    side[r] = [a - factor * p for a, p in zip(side[r], pivot_row)]
+        _pivot(tableau, leaving, entering)
+    else:
+        if side is not None:
+            factors = tableau[:-1, entering].copy()
+            side[leaving] /= factors[leaving]
+            factors[leaving] = 0.0
+            side -= np.outer(factors, side[leaving])
+        _pivot_np(tableau, leaving, entering, scratch)
+
+def _replace_basic(tableau, basic_vars, entering, leaving, pricing, side, scratch):
+    leaving_var = next((var for var, r in basic_vars.items() if r == leaving), None)
+    pricing.update(tableau, leaving, entering, leaving_var)
+    _pivot_basis(tableau, basic_vars, entering, leaving, side, scratch)
+
+def _primal_simplex(tableau, basic_vars, phase, pricing, stats, side=None, max_iter=None, stall=50):
+    """
+    Primal simplex on a tableau in maximization form whose RHS is >= 0, in place.
+    Pivots and time go to stats[phase + "_iterations"] / stats[phase + "_time"]; max_iter caps the
+    pivots counted in stats over all phases. After `stall` degenerate pivots in a row, Bland's rule.
+    status: "optimal", "unbounded" or "iteration_limit"
+    """
+    use_np = not isinstance(tableau, list)
+    find_row = _find_pivot_row_np if use_np else _find_pivot_row
+    bland = BlandPricing()
+    scratch = np.empty_like(tableau) if use_np else None
+    pricing.reset(tableau)
+    degenerate = 0
+    phase_start = time.perf_counter()
+    try:
+        while True:
+            if max_iter is not None and _pivot_count(stats) >= max_iter:
+                return "iteration_limit"
+            # anti-cycling: Bland's rule for both choices while the objective is stuck
+            stalled = degenerate >= stall
+            rule = bland if stalled else pricing
+            entering = rule.select(tableau, basic_vars)
+            if entering is None:
+                return "optimal"
+            row_vars = {r: var for var, r in basic_vars.items()} if stalled else None
+            leaving = find_row(tableau, entering, row_vars)
+            if leaving is None:
+                return "unbounded"
+            if tableau[leaving][-1] <= EPS:
+                degenerate += 1
+                stats["degenerate_pivots"] += 1
+            else:
+                degenerate = 0
+            stats[phase + "_iterations"] += 1
+            _replace_basic(tableau, basic_vars, entering, leaving, pricing, side, scratch)
+    finally:
+        stats[phase + "_time"] += time.perf_counter() - phase_start
+
+def _dual_simplex(tableau, basic_vars, pricing, stats, side=None, max_iter=None, stall=50):
+    """
+    Dual simplex on a tableau whose objective row is >= 0 (dual feasible) but some RHS is negative,
+    in place; stats and max_iter as in _primal_simplex.
+    status: "optimal", "infeasible" or "iteration_limit"
+    """
+    use_np = not isinstance(tableau, list)
+    scratch = np.empty_like(tableau) if use_np else None
+    pricing.reset(tableau)
+    degenerate = 0
+    phase_start = time.perf_counter()
+    try:
+        while True:
+            if max_iter is not None and _pivot_count(stats) >= max_iter:
+                return "iteration_limit"
+            # leaving: most negative basic value; while stalled (Bland) the negative row whose
+            # basic variable has the smallest index
+            if degenerate >= stall:
+                negative = [(var, r) for var, r in basic_vars.items() if tableau[r][-1] < -EPS]
+                leaving = min(negative)[1] if negative else None
+            elif use_np:
+                leaving = int(np.argmin(tableau[:-1, -1])) if len(tableau) > 1 else None
+                if leaving is not None and tableau[leaving, -1] >= -EPS:
+                    leaving = None
+            else:
+                leaving, worst = None, -EPS
+                for i in range(len(tableau) - 1):
+                    if tableau[i][-1] < worst:
+                        leaving, worst = i, tableau[i][-1]
+            if leaving is None:
+                return "optimal"
+            # entering: keep the objective row >= 0, smallest ratio obj[j] / -row[j], ties to the
+            # smallest column
+            row, obj = tableau[leaving], tableau[-1]
+            if use_np:
+                candidates = np.flatnonzero(row[:-1] < -EPS)
+                if not len(candidates):
+                    return "infeasible"
+                ratios = obj[candidates] / -row[candidates]
+                best = ratios.min()
+                entering = int(candidates[np.flatnonzero(ratios <= best + EPS)[0]])
+            else:
+                entering, best = None, None
+                for j in range(len(row) - 1):
+                    if row[j] < -EPS:
+                        ratio = obj[j] / -row[j]
+                        if best is None or ratio < best - EPS:
+                            entering, best = j, ratio
+                if entering is None:
+                    return "infeasible"
+            if best <= EPS:
+                degenerate += 1
+                stats["degenerate_pivots"] += 1
+            else:
+                degenerate = 0
+            stats["dual_iterations"] += 1
+            _replace_basic(tableau, basic_vars, entering, leaving, pricing, side, scratch)
+    finally:
+        stats["dual_time"] += time.perf_counter() - phase_start
+
+def _warm_tableau(prev, c, A, b, signs, use_np):
+    """
+    prev's final tableau updated to the LP (c, A, b, signs): a copy in the requested backend with the
+    changed b and c applied and any appended rows added. Returns (tableau, basic_vars, side, inverse)
+    as in _FinalTableau, or None when prev has no tableau or the LP is not prev's with these changes.
+    """
+    final = prev.final
+    c0, A0, b0, signs0 = prev.problem
+    n, m, m0 = len(c), len(A), len(A0)
+    if final is None or len(c0) != n or m < m0 or list(signs[:m0]) != signs0:
+        return None
+    if use_np:
+        tableau = np.array(final.tableau, dtype=float)
+        side = None if final.side is None else np.array(final.side, dtype=float)
+    else:
+        as_list = lambda t: t.tolist() if np is not None and isinstance(t, np.ndarray) else [list(r) for r in t]
+        tableau = as_list(final.tableau)
+        side = None if final.side is None else as_list(final.side)
+    basic_vars = dict(final.basic_vars)
+    inverse = list(final.inverse)
+
+    # changed right-hand side: B^-1 b moves by B^-1 e_i per changed row
+    for i in range(m0):
+        delta = b[i] - b0[i]
+        if delta:
+            kind, k, mult = inverse[i]
+            if use_np:
+                tableau[:-1, -1] += delta * mult * (tableau[:-1, k] if kind == "col" else side[:, k])
+            else:
+                source = tableau[:-1] if kind == "col" else side
+                for r, row in enumerate(source):
+                    tableau[r][-1] += delta * mult * row[k]
+    # objective row: unchanged c only moves the objective value; otherwise -c reduced against the basic rows
+    if list(c) == c0:
+        tableau[-1][-1] = sum(c[var] * tableau[r][-1] for var, r in basic_vars.items() if var < n)
+    else:
+        tableau[-1] = _objective_row(tableau, basic_vars, c, use_np)
+    # appended rows, reduced against the current basis: an inequality's own slack becomes basic;
+    # an '=' row starts with an artificial (a new `side` column) that is pivoted out straight away
+    # with the dual ratio test, which keeps the objective row >= 0
+    for i in range(m0, m):
+        row = [0.0] * (len(tableau[0]) - 1) + [float(b[i])]
+        for j in range(n):
+            row[j] = float(A[i][j])
+        if signs[i] != '=':
+            slack = len(row) - 1
+            row.insert(slack, 1.0 if signs[i] == '<=' else -1.0)
+            if use_np:
+                tableau = np.insert(tableau, slack, 0.0, axis=1)
+            else:
+                for t in tableau:
+                    t.insert(slack, 0.0)
+        row = np.array(row) if use_np else row
+        side_row = [0.0] * (len(side[0]) if side is not None else 0)
+        for var, r in basic_vars.items():
+            coef = row[var]
+            if abs(coef) > EPS:
+                if use_np:
+                    row -= coef * tableau[r]
+                else:
+                    row = [a - coef * t for a, t in zip(row, tableau[r])]
+                if side is not None:
+                    side_row = [s - coef * t for s, t in zip(side_row, side[r])]
+        if signs[i] != '=':
+            if signs[i] == '>=':
+                row = -row if use_np else [-a for a in row]
+                side_row = [-s for s in side_row]
+            inverse.append(("col", slack, 1.0 if signs[i] == '<=' else -1.0))
+        else:
+            side_row.append(1.0)
+            if side is None:
+                side = np.zeros((len(tableau) - 1, 0)) if use_np else [[] for _ in range(len(tableau) - 1)]
+            if use_np:
+                side = np.hstack([side, np.zeros((len(side), 1))])
+            else:
+                for s in side:
+                    s.append(0.0)
+            inverse.append(("side", len(side_row) - 1, 1.0))
+        r = len(tableau) - 1
+        if use_np:
+            tableau = np.insert(tableau, r, row, axis=0)
+            side = np.vstack([side, side_row]) if side is not None else None
+        else:
+            tableau.insert(r, row)
+            if side is not None:
+                side.append(side_row)
+        if signs[i] != '=':
+            basic_vars[slack] = r
+            continue
+        obj = tableau[-1]
+        entering, best = None, None
+        for j in range(len(row) - 1):
+            if j not in basic_vars and abs(row[j]) > 1e-9:
+                ratio = obj[j] / abs(row[j])
+                if best is None or ratio < best - EPS:
+                    entering, best = j, ratio
+        if entering is not None:
+            _pivot_basis(tableau, basic_vars, entering, r, side)
+    return tableau, basic_vars, side, inverse
+
+def _reoptimize(tableau, basic_vars, side, pricing, stats, max_iter=None, stall=50):
+    """
+    Finish an updated tableau from _warm_tableau: primal simplex if it is still primal feasible, dual
+    simplex if it is still dual feasible; stats["warm_start"] records which. None when it is neither.
+    """
+    # rows without a basic variable are combinations of the others: 0 = rhs must hold
+    covered = set(basic_vars.values())
+    if any(abs(tableau[r][-1]) > 1e-7 for r in range(len(tableau) - 1) if r not in covered):
+        stats["warm_start"] = "update"
+        return "infeasible"
+    if all(tableau[r][-1] >= -EPS for r in range(len(tableau) - 1)):
+        stats["warm_start"] = "primal"
+        return _primal_simplex(tableau, basic_vars, "phase2", pricing, stats, side, max_iter, stall)
+    if all(v >= -EPS for v in tableau[-1][:-1]):
+        stats["warm_start"] = "dual"
+        return _dual_simplex(tableau, basic_vars, pricing, stats, side, max_iter, stall)
+    return None
+
+def two_phase_simplex(c, A, b, signs, backend="python", pricing="dantzig", max_iter=None, stall=50, warm=None,
+                      presolve=False):
     """
     Solve: maximize c^T x subject to A x (signs[i]) b[i], x >= 0
     - c: list of objective coefficients (length n)
     - A: list of rows (m x n)
     - b: RHS list (length m)
     - signs: list of constraint signs, each one of '<=', '>=', '='
-    Returns SimplexResult.
+    - backend: 'python' (lists) or 'numpy' (float64 array, vectorised pivots)
+    - pricing: 'dantzig', 'bland', 'steepest-edge', 'devex', 'partial', or a pricing object
+    - max_iter: cap on pivots over both phases; status "iteration_limit" when reached
+    - stall: after this many degenerate pivots in a row, use Bland's rule until the objective moves
+    - warm: optimal SimplexResult of this LP with another c or b, or with fewer rows (the rows it had
+      unchanged); its final tableau is updated instead of starting over (see resolve)
+    - presolve: shrink the LP with Presolve first; stats["presolve"] reports the eliminations and
+      the result carries no basis (resolve() then solves cold)
+    Returns SimplexResult with iteration counts and timings.
     """
+    if isinstance(pricing, str):
+        if pricing not in PRICING:
+            raise ValueError(f"pricing must be one of {sorted(PRICING)}")
+        pricing = PRICING[pricing]()
+    if presolve:
+        started = time.perf_counter()
+        pre = Presolve(c, A, b, signs)
+        status = pre.reduce()
+        report = dict(pre.report, rows=len(A), columns=len(c))
+        if status == "infeasible":
+            res = SimplexResult("infeasible", stats=_new_stats(pricing.name))
+        else:
+            c2, A2, b2, s2 = pre.reduced()
+            report["presolve_time"] = time.perf_counter() - started
+            # nothing left to pivot on: the list tableau handles the empty problem
+            res = two_phase_simplex(c2, A2, b2, s2, backend if c2 else "python", pricing, max_iter, stall)
+            if res.status == "optimal" and status == "unbounded":
+                res.status, res.objective, res.x = "unbounded", None, []
+            elif res.status == "optimal":
+                res.x = pre.postsolve(res.x)
+                res.objective = sum(cj * xj for cj, xj in zip(c, res.x))
+            report["reduced_rows"], report["reduced_columns"] = len(A2), len(c2)
+        report.setdefault("presolve_time", time.perf_counter() - started)
+        res.stats["presolve"] = report
+        res.stats["time"] = time.perf_counter() - started
+        res.basis, res.final = None, None
+        res.problem = (list(c), [list(row) for row in A], list(b), list(signs))
+        return res
+
+    stats = _new_stats(pricing.name)
+    started = time.perf_counter()
+    # copied, so that later changes to the caller's lists cannot desynchronise resolve()
+    problem = (list(c), [list(row) for row in A], list(b), list(signs))
+
+    def result(status, objective=None, x=None, final=None):
+        stats["time"] = time.perf_counter() - started
+        basis = sorted(final.basic_vars) if final is not None else None
+        return SimplexResult(status, objective, x, _pivot_count(stats), stats, basis, problem, final)
+    if backend not in ("python", "numpy"):
+        raise ValueError("backend must be 'python' or 'numpy'")
+    if backend == "numpy" and np is None:
+        raise ImportError("backend='numpy' needs NumPy installed")
+    use_np = backend == "numpy"
+    pivot = _pivot_np if use_np else _pivot
     # Validate shapes
     m = len(A)
     n = len(c)
     assert len(b) == m and len(signs) == m
 
+    if warm is not None:
+        updated = _warm_tableau(warm, c, A, b, signs, use_np)
+        status = None if updated is None else _reoptimize(*updated[:3], pricing, stats, max_iter, stall)
+        if status == "optimal":
+            tableau, basic_vars, side, inverse = updated
+            obj, x = _extract_solution(tableau, basic_vars, n)
+            return result("optimal", objective=obj, x=x, final=_FinalTableau(tableau, basic_vars, side, inverse))
+        if status is not None:
+            return result(status)
+        stats["warm_start"] = "cold"
+    side = None  # B^-1 columns of the '=' rows, set after Phase I (see _FinalTableau)
+
     # Convert constraints: ensure b >= 0 by multiplying row by -1 if needed
     A2 = [row[:] for row in A]
     b2 = b[:]
     s2 = signs[:]
+    flip = [1.0] * m
     for i in range(m):
         if b2[i] < -EPS:
             # multiply row by -1 and flip sign
+            flip[i] = -1.0
             A2[i] = [-a for a in A2[i]]
             b2[i] = -b2[i]
             if s2[i] == '<=':
@@ -114,13 +923,18 @@ def two_phase_simplex(c, A, b, signs):
 
     total_vars = n + slack_count + artificial_count
     # Build zero-initialized tableau: m constraint rows + 1 objective row, columns = total_vars + 1 (RHS)
-    tableau = [[0.0] * (total_vars + 1) for _ in range(m + 1)]
+    if use_np:
+        tableau = np.zeros((m + 1, total_vars + 1))
+    else:
+        tableau = [[0.0] * (total_vars + 1) for _ in range(m + 1)]
 
     # Keep track: basic variable for each constraint row (var_index -> row)
     basic_vars = {}
 
     slack_pos = n
     art_pos = n + slack_count
+    slack_of_row = [None] * m
+    art_of_row = [None] * m
 
     for i in range(m):
         # original variables coefficients
@@ -131,11 +945,13 @@ def two_phase_simplex(c, A, b, signs):
         # handle sign
         if s2[i] == '<=':
             # add slack variable +1, becomes basic
+            slack_of_row[i] = slack_pos
             tableau[i][slack_pos] = 1.0
             basic_vars[slack_pos] = i
             slack_pos += 1
         elif s2[i] == '>=':
             # add excess variable (-1) and artificial +1
+            slack_of_row[i] = slack_pos
             tableau[i][slack_pos] = -1.0  # excess var (not basic)
             tableau[i][art_pos] = 1.0
             basic_vars[art_pos] = i  # artificial is basic
@@ -143,6 +959,7 @@ def two_phase_simplex(c, A, b, signs):
             art_pos += 1
         elif s2[i] == '=':
             # add artificial var only
+            art_of_row[i] = art_pos
             tableau[i][art_pos] = 1.0
             basic_vars[art_pos] = i
             art_pos += 1
@@ -151,8 +968,10 @@ def two_phase_simplex(c, A, b, signs):
     # Build objective row for phase I
     # objective row should be sum of negative of artificial rows (to make artificials' coefficients zero in basis)
     # We'll make objective row for maximization scheme: maximize (-sum artificials) so that at optimum objective = -sum(artificial values)
-    # Initialize objective row with zeros
+    # Start from the objective itself: coefficient 1 on every artificial (row holds -c, c_j = -1)
     phase1_row = [0.0] * (total_vars + 1)
+    for j in range(n + slack_count, total_vars):
+        phase1_row[j] = 1.0
     # For each artificial var that is basic, add (-1) * that constraint row to objective row
     for var_idx, row in list(basic_vars.items()):
         if var_idx >= n + slack_count:  # it's an artificial variable
@@ -164,43 +983,19 @@ def two_phase_simplex(c, A, b, signs):
     # Record which columns correspond to artificial variables for later removal
     artificial_cols = list(range(n + slack_count, n + slack_count + artificial_count))
 
-    # If there are artificials, we must run phase I; otherwise skip
-    def run_simplex(tableau, basic_vars, allow_unbounded=False):
-        """
-        Run simplex on the provided tableau. The tableau uses maximization form.
-        Returns a tuple (status, tableau, basic_vars)
-        status: "optimal" or "unbounded"
-        """
-        while True:
-            entering = _find_pivot_column(tableau[-1], basic_vars)
-            if entering is None:
-                return "optimal", tableau, basic_vars
-            leaving = _find_pivot_row(tableau, entering)
-            if leaving is None:
-                return "unbounded", tableau, basic_vars
-            # Update basic vars map: find variable leaving (col index in basic_vars)
-            # Remove any existing var that maps to leaving row
-            to_remove = None
-            for var, r in basic_vars.items():
-                if r == leaving:
-                    to_remove = var
-                    break
-            if to_remove is not None:
-                del basic_vars[to_remove]
-            basic_vars[entering] = leaving
-            _pivot(tableau, leaving, entering)
-
     if artificial_count > 0:
-        status, tableau, basic_vars = run_simplex(tableau, basic_vars, allow_unbounded=False)
+        status = _primal_simplex(tableau, basic_vars, "phase1", pricing, stats, max_iter=max_iter, stall=stall)
+        if status == "iteration_limit":
+            return result(status)
         if status == "unbounded":
             # If phase I is unbounded, something is odd; treat as infeasible
-            return SimplexResult("infeasible")
+            return result("infeasible")
         # Check phase I objective value: tableau[-1][-1] is max(-sum artificials)
         phase1_obj = tableau[-1][-1]
         # Because we maximized negative sum of artificials, optimal value should be approximately 0 for feasibility
         if abs(phase1_obj) > 1e-7:
             # infeasible
-            return SimplexResult("infeasible")
+            return result("infeasible")
         # Remove artificial columns from tableau
         # But first, if any artificial is basic, we must pivot it out using a non-artificial entering variable.
         for art_col in artificial_cols:
@@ -216,18 +1011,28 @@ def two_phase_simplex(c, A, b, signs):
                     # replace basic var
                     del basic_vars[art_col]
                     basic_vars[pivot_col] = row
-                    _pivot(tableau, row, pivot_col)
+                    pivot(tableau, row, pivot_col)
                 else:
                     # entire row zero except artificial -> variable is redundant; drop artificial
                     del basic_vars[art_col]
+        # B^-1 columns of the '=' rows, carried through Phase II for resolve()
+        eq_arts = [art_of_row[i] for i in range(m) if art_of_row[i] is not None]
+        if eq_arts:
+            if use_np:
+                side = tableau[:m, eq_arts]
+            else:
+                side = [[tableau[r][j] for j in eq_arts] for r in range(m)]
         # Now actually remove artificial columns from tableau structure
         # Build new tableau removing artificial columns
         keep_cols = [j for j in range(total_vars) if j not in artificial_cols] + [total_vars]  # keep RHS at end
         new_nvars = len(keep_cols) - 1
-        new_tableau = []
-        for r in range(len(tableau)):
-            new_row = [tableau[r][j] for j in keep_cols]
-            new_tableau.append(new_row)
+        if use_np:
+            new_tableau = tableau[:, keep_cols]
+        else:
+            new_tableau = []
+            for r in range(len(tableau)):
+                new_row = [tableau[r][j] for j in keep_cols]
+                new_tableau.append(new_row)
         # Remap basic_vars indices to new column indices
         new_basic = {}
         col_map = {}
@@ -244,29 +1049,85 @@ def two_phase_simplex(c, A, b, signs):
         total_vars = new_nvars
 
     # Phase II: build real objective row (maximize c^T x)
-    # objective row should be negative coefficients for maximization scheme (we put them directly because our tableau uses maximize)
-    obj_row = [0.0] * (total_vars + 1)
-    # place c in columns corresponding to original variables
-    for j in range(n):
-        if j < total_vars:
-            obj_row[j] = -c[j]  # we will maximize; tableau convention: last row contains coefficients that are subtracted
-    # If some basic variables correspond to original variables or slacks, we need to make objective row consistent:
-    # subtract basic rows times their coefficient in obj_row so that basic variables have 0 coefficient in objective row
-    for var, row in list(basic_vars.items()):
-        coef = obj_row[var] if var < len(obj_row) - 1 else 0.0
-        if abs(coef) > EPS:
-            for col in range(len(obj_row)):
-                obj_row[col] -= coef * tableau[row][col]
-    tableau[-1] = obj_row
+    tableau[-1] = _objective_row(tableau, basic_vars, c, use_np)
 
     # Run Phase II simplex
-    status, tableau, basic_vars = run_simplex(tableau, basic_vars, allow_unbounded=True)
-    if status == "unbounded":
-        return SimplexResult("unbounded")
+    status = _primal_simplex(tableau, basic_vars, "phase2", pricing, stats, side, max_iter, stall)
+    if status != "optimal":
+        return result(status)
 
     # Extract solution
     obj, x = _extract_solution(tableau, basic_vars, n)
-    return SimplexResult("optimal", objective=obj, x=x)
+    inverse = []
+    eq_count = 0
+    for i in range(m):
+        if slack_of_row[i] is not None:
+            inverse.append(("col", slack_of_row[i], flip[i] * (1.0 if s2[i] == '<=' else -1.0)))
+        else:
+            inverse.append(("side", eq_count, flip[i]))
+            eq_count += 1
+    return result("optimal", objective=obj, x=x, final=_FinalTableau(tableau, basic_vars, side, inverse))
+
+def resolve(result, c=None, b=None, new_rows=None, new_b=None, new_signs=None, **options):
+    """
+    Re-solve the LP behind `result` (from two_phase_simplex or resolve) from its final tableau:
+    - c, b: replacement objective / right-hand side (None keeps the old one)
+    - new_rows, new_b, new_signs: constraints appended below the existing ones
+    Only the changes are applied to a copy of the tableau (`result` stays reusable). A changed b or
+    new constraints are then finished by dual simplex, a changed c by primal simplex; when the
+    updated tableau is neither primal nor dual feasible, or `result` has no tableau (not optimal,
+    or presolved), this is a cold two-phase solve. Other options as two_phase_simplex.
+    """
+    c0, A0, b0, signs0 = result.problem
+    A = A0 + list(new_rows or [])
+    b = list(b0 if b is None else b) + list(new_b or [])
+    signs = signs0 + list(new_signs or [])
+    return two_phase_simplex(list(c0 if c is None else c), A, b, signs, warm=result, **options)
+
+def compare_pricing(c, A, b, signs, backend="python", rules=None, max_iter=None):
+    """Solve with each pricing rule and print pivots, degenerate pivots and time."""
+    for rule in rules or PRICING:
+        res = two_phase_simplex(c, A, b, signs, backend=backend, pricing=rule, max_iter=max_iter)
+        print(f"{res.stats['pricing']:>13}: {res.status} {res.objective} in {res.iterations} pivots "
+              f"({res.stats['degenerate_pivots']} degenerate), {res.stats['time']:.3f}s")
+
+# k x k assignment as an LP: every vertex is degenerate, like shift/slot scheduling models
+def assignment_lp(k, seed=0):
+    rng = random.Random(seed)
+    c = [rng.randint(1, 50) for _ in range(k * k)]
+    A, b = [], []
+    for i in range(k):
+        A.append([1 if j // k == i else 0 for j in range(k * k)])
+        A.append([1 if j % k == i else 0 for j in range(k * k)])
+        b += [1, 1]
+    return c, A, b, ['='] * (2 * k)
+
+# production-planning LP on k products with the clutter a modelling layer emits: bounds written as
+# singleton rows, fixed products, every capacity row repeated at another scale, an aggregate row
+# that the bounds already imply, and unused columns
+def cluttered_lp(k, seed=0):
+    rng = random.Random(seed)
+    n = k + k // 4
+    c = [rng.randint(1, 20) for _ in range(k)] + [-rng.randint(1, 5) for _ in range(n - k)]
+    A, b, signs = [], [], []
+
+    def row(coefs, rhs, sign):
+        A.append([coefs.get(j, 0) for j in range(n)])
+        b.append(rhs)
+        signs.append(sign)
+
+    for _ in range(k // 2):
+        coefs = {j: rng.randint(1, 9) for j in rng.sample(range(k), k // 3)}
+        rhs = rng.randint(10 * k, 20 * k)
+        row(coefs, rhs, '<=')
+        row({j: 2 * v for j, v in coefs.items()}, 2 * rhs, '<=')
+    for j in range(k):
+        if j % 5 == 0:
+            row({j: 1}, rng.randint(0, 3), '=')
+        else:
+            row({j: 1}, rng.randint(5, 15), '<=')
+    row(dict.fromkeys(range(k), 1), 20 * k, '<=')
+    return c, A, b, signs
 
 # ---------------------------
 # Example usage
@@ -302,3 +1163,22 @@ if __name__ == "__main__":
     signs2 = ['=', '>=']
     res2 = two_phase_simplex(c2, A2, b2, signs2)
     print("Example 2:", res2)
+
+    if np is not None:
+        print("Example 2 (numpy):", two_phase_simplex(c2, A2, b2, signs2, backend="numpy"))
+
+    # Example 1 again, warm-started from its optimal basis
+    more = resolve(res, b=[4, 3])
+    print("Example 1, b = [4, 3]:", more, more.stats["warm_start"], more.iterations)
+    cut = resolve(res, new_rows=[[1, 0]], new_b=[2], new_signs=['<='])
+    print("Example 1 + x <= 2:", cut, cut.stats["warm_start"], cut.iterations)
+
+    c3, A3, b3, signs3 = cluttered_lp(60)
+    for presolve in (False, True):
+        res3 = two_phase_simplex(c3, A3, b3, signs3, presolve=presolve)
+        print(f"cluttered LP {len(A3)} x {len(c3)}, presolve={presolve}: {res3.status} {res3.objective:.4f} "
+              f"in {res3.iterations} pivots, {res3.stats['time']:.3f}s")
+    print("  eliminated:", {k: v for k, v in res3.stats["presolve"].items() if v and not k.endswith("time")})
+
+    print("Pricing rules on a 12 x 12 assignment LP:")
+    compare_pricing(*assignment_lp(12))
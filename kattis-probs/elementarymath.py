@@ -3,10 +3,95 @@ from collections import deque
 
 INF = 10**9
 
-def hopcroftKarp(adj, n_right):
-    n_left = len(adj)
+#Adjacency can be given as lists (adj[u] = right neighbours of left vertex u) or in CSR form:
+#the neighbours of u are targets[offsets[u]:offsets[u + 1]].
+def toCSR(adj):
+    offsets = [0] * (len(adj) + 1)
+    for u, nbrs in enumerate(adj):
+        offsets[u + 1] = offsets[u] + len(nbrs)
+    targets = [v for nbrs in adj for v in nbrs]
+    return offsets, targets
+
+#Karp-Sipser initial matching: a vertex with one unmatched neighbour left can always be matched
+#to it without losing optimality, so do that while possible, otherwise match greedily.
+#Degrees count unmatched neighbours and are kept up to date on both sides.
+def karpSipser(offsets, targets, n_right):
+    n_left = len(offsets) - 1
     matchL = [-1] * n_left
     matchR = [-1] * n_right
+    r_offsets = [0] * (n_right + 1)
+    for v in targets:
+        r_offsets[v + 1] += 1
+    for v in range(n_right):
+        r_offsets[v + 1] += r_offsets[v]
+    fill = r_offsets[:-1]
+    r_targets = [0] * len(targets)
+    for u in range(n_left):
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            r_targets[fill[v]] = u
+            fill[v] += 1
+    degL = [offsets[u + 1] - offsets[u] for u in range(n_left)]
+    degR = [r_offsets[v + 1] - r_offsets[v] for v in range(n_right)]
+    # left vertices as u, right vertices as ~v
+    ones = deque([u for u in range(n_left) if degL[u] == 1] + [~v for v in range(n_right) if degR[v] == 1])
+
+    def match(u, v):
+        matchL[u] = v
+        matchR[v] = u
+        for i in range(offsets[u], offsets[u + 1]):
+            w = targets[i]
+            if matchR[w] == -1:
+                degR[w] -= 1
+                if degR[w] == 1:
+                    ones.append(~w)
+        for i in range(r_offsets[v], r_offsets[v + 1]):
+            w = r_targets[i]
+            if matchL[w] == -1:
+                degL[w] -= 1
+                if degL[w] == 1:
+                    ones.append(w)
+
+    matching = 0
+    nxt = 0  # greedy scan position
+    while True:
+        if ones:
+            x = ones.popleft()
+            if x >= 0:
+                if matchL[x] != -1 or degL[x] == 0:
+                    continue
+                for i in range(offsets[x], offsets[x + 1]):
+                    if matchR[targets[i]] == -1:
+                        match(x, targets[i])
+                        break
+            else:
+                v = ~x
+                if matchR[v] != -1 or degR[v] == 0:
+                    continue
+                for i in range(r_offsets[v], r_offsets[v + 1]):
+                    if matchL[r_targets[i]] == -1:
+                        match(r_targets[i], v)
+                        break
+            matching += 1
+            continue
+        while nxt < n_left and (matchL[nxt] != -1 or degL[nxt] == 0):
+            nxt += 1
+        if nxt == n_left:
+            break
+        for i in range(offsets[nxt], offsets[nxt + 1]):
+            if matchR[targets[i]] == -1:
+                match(nxt, targets[i])
+                break
+        matching += 1
+    return matchL, matchR, matching
+
+#Returns (matchL, matchR, matching, phases)
+def hopcroftKarpCSR(offsets, targets, n_right, warm_start=True):
+    n_left = len(offsets) - 1
+    if warm_start:
+        matchL, matchR, matching = karpSipser(offsets, targets, n_right)
+    else:
+        matchL, matchR, matching = [-1] * n_left, [-1] * n_right, 0
     dist = [0] * n_left
 
     def bfs():
@@ -20,29 +105,53 @@ def hopcroftKarp(adj, n_right):
         found = False
         while q:
             u = q.popleft()
-            for v in adj[u]:
-                if matchR[v] == -1:
+            for i in range(offsets[u], offsets[u + 1]):
+                w = matchR[targets[i]]
+                if w == -1:
                     found = True  # free node on right side
-                elif dist[matchR[v]] == INF:
-                    dist[matchR[v]] = dist[u] + 1
-                    q.append(matchR[v])
+                elif dist[w] == INF:
+                    dist[w] = dist[u] + 1
+                    q.append(w)
         return found
-    
-    def dfs(u):
-        for v in adj[u]:
-            if matchR[v] == -1 or (dist[matchR[v]] == dist[u] + 1 and dfs(matchR[v])):
-                matchL[u] = v
-                matchR[v] = u
+
+    # augmenting path from root along the BFS layers, with an explicit stack of left vertices;
+    # it[u] is the edge of u being tried, so the path is read off the stack when a free right vertex is hit
+    def dfs(root, it):
+        stack = [root]
+        while stack:
+            u = stack[-1]
+            i = it[u]
+            if i == offsets[u + 1]:
+                dist[u] = INF
+                stack.pop()
+                if stack:
+                    it[stack[-1]] += 1
+                continue
+            w = matchR[targets[i]]
+            if w == -1:
+                for x in stack:
+                    v = targets[it[x]]
+                    matchL[x] = v
+                    matchR[v] = x
                 return True
-        dist[u] = INF
+            if dist[w] == dist[u] + 1:
+                stack.append(w)
+            else:
+                it[u] = i + 1
         return False
-    
-    matching = 0
+
+    phases = 0
     while bfs():
+        phases += 1
+        it = offsets[:-1]
         for i in range(n_left):
-            if matchL[i] == -1 and dfs(i):
+            if matchL[i] == -1 and dfs(i, it):
                 matching += 1
 
+    return matchL, matchR, matching, phases
+
+def hopcroftKarp(adj, n_right, warm_start=True):
+    matchL, matchR, _, _ = hopcroftKarpCSR(*toCSR(adj), n_right, warm_start)
     return matchL, matchR
 
 def elementary_math(pairs):
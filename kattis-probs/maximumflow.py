@@ -1,72 +1,144 @@
 #https://open.kattis.com/problems/maxflow 4.0 Difficulty
 from collections import deque
 
-class Edge:
-    def __init__(self, u, v, cap):
-        self.u = u
-        self.v = v
-        self.cap = cap
-        self.flow = 0
-        self.rev = None  # pointer to reverse edge
-
-#ADJACENCY LISTS
+#ADJACENCY LISTS of edge ids over flat edge arrays (same layout as algorithm-examples/flowgraph.py):
+#edges are added in pairs so the reverse of e is e ^ 1 and its tail is to[e ^ 1]
+#FIFO push-relabel with a current-arc pointer per vertex. Two heuristics can be switched off for comparison:
+# - global_relabel: exact distance labels by reverse BFS from the sink, at the start and then every n relabels
+# - gap: when no vertex is left at some height k < n, every vertex above k can no longer reach the sink
+#After getMaxFlow the residual state is kept: setCapacity/increaseCapacity/decreaseCapacity/addEdge on the
+#solved network, then reoptimize() restarts push-relabel from the current flow instead of from zero.
 class FlowNetwork:
-    def __init__(self, n):
+    def __init__(self, n, global_relabel=True, gap=True):
         self.n = n
         self.graph = [[] for _ in range(n)]
+        self.to = []
+        self.cap = []
+        self.flow = []
         self.h = [0]*n
         self.excess = [0]*n
+        self.cur = [0]*n  # current arc
+        self.count = [0]*(2*n + 1)  # vertices per height, for the gap heuristic
+        self.global_relabel = global_relabel
+        self.gap = gap
+        self.relabels = 0
+        self.s = self.t = None
 
+    # run on an existing flowgraph.FlowGraph, sharing its to/cap/flow arrays
+    @classmethod
+    def from_graph(cls, g, global_relabel=True, gap=True):
+        net = cls(g.n, global_relabel, gap)
+        net.to, net.cap, net.flow = g.to, g.cap, g.flow
+        net.graph = [list(g.out_edges(u)) for u in range(g.n)]
+        return net
+
+    # returns the id of the forward edge; the reverse is id ^ 1
     def addEdge(self, u, v, cap):
-        fwd = Edge(u, v, cap)
-        rev = Edge(v, u, 0)
-        fwd.rev = rev
-        rev.rev = fwd
-        self.graph[u].append(fwd)
-        self.graph[v].append(rev)
-
-    def push(self, e):
-        u, v = e.u, e.v
-        send = min(self.excess[u], e.cap - e.flow)
+        e = len(self.to)
+        self.graph[u].append(e)
+        self.to.append(v)
+        self.cap.append(cap)
+        self.flow.append(0)
+        self.graph[v].append(len(self.to))
+        self.to.append(u)
+        self.cap.append(0)
+        self.flow.append(0)
+        return e
+
+    # forward edges as (u, v, flow)
+    def edges(self):
+        for e in range(0, len(self.to), 2):
+            yield self.to[e + 1], self.to[e], self.flow[e]
+
+    def push(self, u, e):
+        v = self.to[e]
+        send = min(self.excess[u], self.cap[e] - self.flow[e])
         if send > 0 and self.h[u] == self.h[v] + 1:
-            e.flow += send
-            e.rev.flow -= send
+            self.flow[e] += send
+            self.flow[e ^ 1] -= send
             self.excess[u] -= send
             self.excess[v] += send
             return True
         return False
 
     def relabel(self, u):
-        min_h = float("inf")
+        n = self.n
+        old = self.h[u]
+        min_h = 2*n
         for e in self.graph[u]:
-            if e.cap > e.flow:
-                min_h = min(min_h, self.h[e.v])
-        if min_h < float("inf"):
-            self.h[u] = min_h + 1
+            if self.cap[e] > self.flow[e] and self.h[self.to[e]] < min_h:
+                min_h = self.h[self.to[e]]
+        new = min_h + 1 if min_h < 2*n else 2*n
+        self.count[old] -= 1
+        self.h[u] = new
+        self.count[new] += 1
+        self.relabels += 1
+        if self.gap and self.count[old] == 0 and old < n:
+            self._gap(old)
+
+    # nothing is left at height k < n, so vertices above it are cut off from the sink
+    def _gap(self, k):
+        n = self.n
+        for v in range(n):
+            if k < self.h[v] < n:
+                self.count[self.h[v]] -= 1
+                self.h[v] = n + 1
+                self.count[n + 1] += 1
+                self.cur[v] = 0
+
+    # exact labels: distance to t in the residual graph, or n + distance to s for vertices that cannot reach t
+    def _global_relabel(self):
+        n = self.n
+        h = [-1]*n
+        for root, base in ((self.t, 0), (self.s, n)):
+            h[root] = base
+            q = deque([root])
+            while q:
+                x = q.popleft()
+                for e in self.graph[x]:
+                    y = self.to[e]
+                    # e ^ 1 is the edge y -> x
+                    if h[y] < 0 and self.cap[e ^ 1] > self.flow[e ^ 1]:
+                        h[y] = h[x] + 1
+                        q.append(y)
+        self.count = [0]*(2*n + 1)
+        for v in range(n):
+            if h[v] < 0:
+                h[v] = 2*n  # unreachable either way; carries no excess
+            self.count[h[v]] += 1
+        self.h = h
+        self.cur = [0]*n
+        self.relabels = 0
 
     def discharge(self, u, active, in_queue):
+        edges = self.graph[u]
         while self.excess[u] > 0:
-            pushed = False
-            for e in self.graph[u]:
-                if self.push(e):
-                    if e.v not in in_queue and e.v != self.s and e.v != self.t:
-                        active.append(e.v)
-                        in_queue.add(e.v)
-                    if self.excess[u] == 0:
-                        pushed = True
-                        break
-            if not pushed:
+            if self.cur[u] == len(edges):
                 self.relabel(u)
+                self.cur[u] = 0
+                continue
+            e = edges[self.cur[u]]
+            if self.push(u, e):
+                v = self.to[e]
+                if v not in in_queue and v != self.s and v != self.t:
+                    active.append(v)
+                    in_queue.add(v)
+            else:
+                self.cur[u] += 1
 
-    def getMaxFlow(self, s, t):
-        self.s, self.t = s, t
-        self.h[s] = self.n
+    # saturate every residual edge out of s
+    def _saturate_source(self):
+        s = self.s
         for e in self.graph[s]:
-            e.flow = e.cap
-            e.rev.flow = -e.cap
-            self.excess[e.v] += e.cap
-            self.excess[s] -= e.cap
+            send = self.cap[e] - self.flow[e]
+            if send > 0:
+                self.flow[e] += send
+                self.flow[e ^ 1] -= send
+                self.excess[self.to[e]] += send
+                self.excess[s] -= send
 
+    def _run(self):
+        s, t = self.s, self.t
         active = deque([v for v in range(self.n) if v != s and v != t and self.excess[v] > 0])
         in_queue = set(active)
 
@@ -74,18 +146,108 @@ class FlowNetwork:
             u = active.popleft()
             in_queue.remove(u)
             self.discharge(u, active, in_queue)
+            if self.global_relabel and self.relabels >= self.n:
+                self._global_relabel()
+
+        return sum(self.flow[e] for e in self.graph[s])
+
+    def getMaxFlow(self, s, t):
+        self.s, self.t = s, t
+        self.h[s] = self.n
+        self.count[0] = self.n - 1
+        self.count[self.n] = 1
+        self._saturate_source()
+        if self.global_relabel:
+            self._global_relabel()
+        return self._run()
+
+    # (source side, cut edges as (u, v, capacity)) from the residual graph of the last solve
+    def min_cut(self):
+        side = [False]*self.n
+        side[self.s] = True
+        q = deque([self.s])
+        while q:
+            x = q.popleft()
+            for e in self.graph[x]:
+                y = self.to[e]
+                if not side[y] and self.cap[e] > self.flow[e]:
+                    side[y] = True
+                    q.append(y)
+        cut = [(self.to[e + 1], self.to[e], self.cap[e]) for e in range(0, len(self.to), 2)
+               if side[self.to[e + 1]] and not side[self.to[e]] and self.cap[e] > 0]
+        return [v for v in range(self.n) if side[v]], cut
+
+    # new capacity for edge e (an id returned by addEdge); call reoptimize() after a batch of changes
+    def setCapacity(self, e, cap):
+        self.cap[e] = cap
+        over = self.flow[e] - cap
+        if over > 0:
+            # send the overflow back: u keeps it as excess, v's outflow is cut by the same amount
+            u, v = self.to[e ^ 1], self.to[e]
+            self.flow[e] -= over
+            self.flow[e ^ 1] += over
+            self.excess[u] += over
+            self.excess[v] -= over
+            if self.s is not None and v != self.s and v != self.t:
+                self._cancel_deficit(v)
+
+    def increaseCapacity(self, e, delta):
+        self.setCapacity(e, self.cap[e] + delta)
+
+    def decreaseCapacity(self, e, delta):
+        self.setCapacity(e, max(self.cap[e] - delta, 0))
+
+    # v sends out more than it receives: undo flow along paths of flow-carrying edges from v
+    # to t or to a vertex holding excess, until v balances
+    def _cancel_deficit(self, v):
+        t = self.t
+        while self.excess[v] < 0:
+            parent = {v: -1}
+            q = deque([v])
+            end = None
+            while q and end is None:
+                x = q.popleft()
+                for e in self.graph[x]:
+                    y = self.to[e]
+                    if self.flow[e] > 0 and y not in parent:
+                        parent[y] = e
+                        if y == t or self.excess[y] > 0:
+                            end = y
+                            break
+                        q.append(y)
+            d = -self.excess[v]
+            if end != t:
+                d = min(d, self.excess[end])
+            y = end
+            while y != v:
+                e = parent[y]
+                d = min(d, self.flow[e])
+                y = self.to[e ^ 1]
+            y = end
+            while y != v:
+                e = parent[y]
+                self.flow[e] -= d
+                self.flow[e ^ 1] += d
+                y = self.to[e ^ 1]
+            self.excess[end] -= d
+            self.excess[v] += d
 
-        return sum(e.flow for e in self.graph[s])
+    # max flow after capacity changes or new edges, continuing from the current flow
+    def reoptimize(self):
+        self._saturate_source()
+        self._global_relabel()
+        return self._run()
 
-n, m, s, t = map(int, input().split())
-G = FlowNetwork(n)
-for _ in range(m):
-    u, v, c = map(int, input().split())
-    G.addEdge(u, v, c)
+if __name__ == "__main__":
+    n, m, s, t = map(int, input().split())
+    G = FlowNetwork(n)
+    for _ in range(m):
+        u, v, c = map(int, input().split())
+        G.addEdge(u, v, c)
 
-flow = G.getMaxFlow(s, t)
-used = [(e.u, e.v, e.flow) for u in range(n) for e in G.graph[u] if e.flow > 0]
+    flow = G.getMaxFlow(s, t)
+    used = [(u, v, f) for u, v, f in G.edges() if f > 0]
 
-print(n, flow, len(used))
-for u, v, f in used:
-    print(u, v, f)
+    print(n, flow, len(used))
+    for u, v, f in used:
+        print(u, v, f)
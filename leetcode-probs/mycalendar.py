@@ -3,6 +3,8 @@ RED = True
 BLACK = False
 
 class Node:
+    __slots__ = ('key', 'value', 'color', 'left', 'right', 'parent')
+
     def __init__(self, key, value, color=RED):
         self.key = key
         self.value = value
@@ -15,6 +17,10 @@ class Node:
 class RedBlackTree:
     def __init__(self):
         self.root = None
+        self.n = 0
+
+    def __len__(self):
+        return self.n
 
     def _is_red(self, node):
         return node is not None and node.color == RED
@@ -64,6 +70,7 @@ class RedBlackTree:
         if self.root is None:
             self.root = new_node
             self.root.color = BLACK
+            self.n = 1
             return
 
         parent = None
@@ -78,14 +85,76 @@ class RedBlackTree:
                 curr.value = value
                 return
 
+        self._attach(parent, new_node)
+
+    # Insert the interval [key, value) only if it overlaps no stored interval, in a single descent.
+    # The floor and ceiling of key both lie on its search path, so checking each node passed is enough.
+    def insert_if_free(self, key, value):
+        parent = None
+        curr = self.root
+        while curr:
+            parent = curr
+            if key < curr.key:
+                if value > curr.key:
+                    return False
+                curr = curr.left
+            elif key > curr.key:
+                if curr.value > key:
+                    return False
+                curr = curr.right
+            else:
+                return False
+
+        new_node = Node(key, value)
+        if parent is None:
+            new_node.color = BLACK
+            self.root = new_node
+            self.n = 1
+        else:
+            self._attach(parent, new_node)
+        return True
+
+    def _attach(self, parent, new_node):
         new_node.parent = parent
-        if key < parent.key:
+        if new_node.key < parent.key:
             parent.left = new_node
         else:
             parent.right = new_node
-
+        self.n += 1
         self._fix_insert(new_node)
 
+    # In-order (key, value) pairs without recursion
+    def items(self):
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key, node.value
+            node = node.right
+
+    # Rebuild from sorted (key, value) pairs in O(n): midpoint split, partial last level red
+    def build_sorted(self, pairs):
+        n = len(pairs)
+        deepest = n.bit_length() - 1
+        red_leaves = (n + 1) & n != 0
+
+        def build(lo, hi, depth, parent):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = Node(pairs[mid][0], pairs[mid][1],
+                        RED if red_leaves and depth == deepest and depth > 0 else BLACK)
+            node.parent = parent
+            node.left = build(lo, mid, depth + 1, node)
+            node.right = build(mid + 1, hi, depth + 1, node)
+            return node
+
+        self.root = build(0, n, 0, None)
+        self.n = n
+
     # Simplified rotation/fix logic
     def _rotate_left(self, node):
         right = node.right
@@ -156,12 +225,132 @@ class MyCalendar:
         self.calendar = RedBlackTree()
 
     def book(self, startTime: int, endTime: int) -> bool:
-        floorkey = self.calendar.floor_key(startTime)
-        ceilkey = self.calendar.ceiling_key(startTime)
+        return self.calendar.insert_if_free(startTime, endTime)
+
+    # Book a batch sorted by start time, in order. Returns one bool per request.
+    # Large batches are swept against the existing bookings and the tree is rebuilt in O(n + k);
+    # small ones fall back to one descent per request.
+    def book_many(self, bookings):
+        for i in range(1, len(bookings)):
+            if bookings[i][0] < bookings[i - 1][0]:
+                raise ValueError("bookings must be sorted by start time")
+        if len(bookings) <= len(self.calendar):
+            return [self.book(s, e) for s, e in bookings]
 
-        if ((floorkey is None or self.calendar.get(floorkey) <= startTime)
-            and (ceilkey is None or endTime <= ceilkey)):
-            self.calendar.insert(startTime, endTime)
-            return True
+        existing = list(self.calendar.items())
+        results = []
+        accepted = []
+        j = 0
+        for s, e in bookings:
+            while j < len(existing) and existing[j][1] <= s:
+                j += 1
+            ok = not (j < len(existing) and existing[j][0] < e) and not (accepted and accepted[-1][1] > s)
+            if ok:
+                accepted.append((s, e))
+            results.append(ok)
+
+        merged = []
+        i = j = 0
+        while i < len(existing) or j < len(accepted):
+            if j == len(accepted) or (i < len(existing) and existing[i][0] < accepted[j][0]):
+                merged.append(existing[i])
+                i += 1
+            else:
+                merged.append(accepted[j])
+                j += 1
+        self.calendar.build_sorted(merged)
+        return results
+
+
+#Dynamic lazy segment tree over [lo, hi): range add, range max. Nodes are created on demand
+#and stored in parallel lists; the pending add of a node is kept on the node (never pushed down),
+#so mx[node] = lazy[node] + max of its children. Ranges must lie inside [lo, hi) (ValueError otherwise).
+class LazySegmentTree:
+    def __init__(self, lo=0, hi=10**9):
+        self.lo = lo
+        self.hi = hi
+        self.left = [0]   # 0 = no child (the root is never a child)
+        self.right = [0]
+        self.mx = [0]
+        self.lazy = [0]
+
+    def _new(self):
+        self.left.append(0)
+        self.right.append(0)
+        self.mx.append(0)
+        self.lazy.append(0)
+        return len(self.mx) - 1
+
+    def _check(self, l, r):
+        if not self.lo <= l < r <= self.hi:
+            raise ValueError(f"range [{l}, {r}) is empty or outside [{self.lo}, {self.hi})")
+
+    def add(self, l, r, v):
+        self._check(l, r)
+        self._add(0, self.lo, self.hi, l, r, v)
+
+    def _add(self, node, nl, nr, l, r, v):
+        if r <= nl or nr <= l:
+            return
+        if l <= nl and nr <= r:
+            self.mx[node] += v
+            self.lazy[node] += v
+            return
+        mid = (nl + nr) // 2
+        if not self.left[node]:
+            self.left[node] = self._new()
+            self.right[node] = self._new()
+        self._add(self.left[node], nl, mid, l, r, v)
+        self._add(self.right[node], mid, nr, l, r, v)
+        self.mx[node] = self.lazy[node] + max(self.mx[self.left[node]], self.mx[self.right[node]])
+
+    def max(self, l, r):
+        self._check(l, r)
+        return self._max(0, self.lo, self.hi, l, r)
+
+    def _max(self, node, nl, nr, l, r):
+        if r <= nl or nr <= l:
+            return float("-inf")
+        if l <= nl and nr <= r:
+            return self.mx[node]
+        if not self.left[node]:
+            return self.lazy[node]  # whole range shares this node's count
+        mid = (nl + nr) // 2
+        return self.lazy[node] + max(self._max(self.left[node], nl, mid, l, r),
+                                     self._max(self.right[node], mid, nr, l, r))
+
+
+#Overlapping bookings allowed up to max_overlap at any instant (max_overlap=1 is MyCalendar)
+class OverlapCalendar:
+    def __init__(self, max_overlap, lo=0, hi=10**9):
+        self.max_overlap = max_overlap
+        self.tree = LazySegmentTree(lo, hi)
+
+    def book(self, startTime: int, endTime: int) -> bool:
+        if self.tree.max(startTime, endTime) >= self.max_overlap:
+            return False
+        self.tree.add(startTime, endTime, 1)
+        return True
+
+    def book_many(self, bookings):
+        return [self.book(s, e) for s, e in bookings]
+
+    # number of bookings covering time t
+    def count(self, t):
+        return self.tree.max(t, t + 1)
+
+
+#LeetCode 731: double booking allowed, triple booking rejected
+class MyCalendarTwo(OverlapCalendar):
+    def __init__(self):
+        super().__init__(2)
+
+
+#LeetCode 732: every booking is accepted, returns the maximum k-booking so far
+class MyCalendarThree:
+    def __init__(self):
+        self.tree = LazySegmentTree()
 
-        return False
+    def book(self, startTime: int, endTime: int) -> int:
+        self.tree.add(startTime, endTime, 1)
+        return self.tree.mx[0]